@@ -0,0 +1,132 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+
+from fairlib import SimpleAgent
+
+from workout_pipeline import with_fresh_memory
+
+# Agents kept per role; at most this many requests use a role at once.
+AGENT_POOL_SIZE = int(os.getenv("WORKOUT_AGENT_POOL_SIZE", 4))
+# Seconds a request waits for a busy role before giving up (TimeoutError).
+AGENT_WAIT_TIMEOUT = float(os.getenv("WORKOUT_AGENT_WAIT_TIMEOUT", 120))
+
+AgentBuilder = Callable[[], Awaitable[SimpleAgent]]
+
+
+class _RolePool:
+    """The agents of one role: idle ones in a FIFO queue, built on demand."""
+
+    def __init__(self, build: AgentBuilder, size: int, timeout: Optional[float]):
+        self._build = build
+        self.size = size
+        self.timeout = timeout
+        self._base: Optional[SimpleAgent] = None
+        self._base_lock = asyncio.Lock()
+        self._idle: "asyncio.Queue[SimpleAgent]" = asyncio.Queue()
+        self.created = 0
+
+    @property
+    def idle(self) -> int:
+        return self._idle.qsize()
+
+    async def acquire(self) -> SimpleAgent:
+        if self._idle.empty() and self.created < self.size:
+            self.created += 1
+            try:
+                return await self._new_agent()
+            except BaseException:
+                self.created -= 1
+                raise
+        # Waiters are served in arrival order as agents come back; a bounded
+        # wait means an agent that is never returned cannot hang every
+        # later request.
+        return await asyncio.wait_for(self._idle.get(), self.timeout)
+
+    def release(self, agent: SimpleAgent):
+        agent.memory.clear()
+        self._idle.put_nowait(agent)
+
+    async def _new_agent(self) -> SimpleAgent:
+        async with self._base_lock:
+            if self._base is None:
+                self._base = await self._build()
+                return self._base
+        # LLM adapter, planner and tool executor are shared and stateless;
+        # only the memory is per agent.
+        return with_fresh_memory(self._base)
+
+
+class AgentPool:
+    """
+    Prebuilt agents per role, checked out for one request at a time.
+
+    Role:
+      - A SimpleAgent carries mutable memory, so concurrent requests each
+        need their own. The pool hands out an idle agent, builds one (up to
+        `size` per role) if none is idle, and otherwise queues the caller
+        until one is returned, for at most `timeout` seconds.
+      - Only the first agent of a role pays full construction (LLM adapter,
+        tool registry, planner); the rest share those and add a memory.
+      - Memory is cleared on return, so nothing leaks between requests, and
+        the number of agents (and their memories) never exceeds `size`.
+      - Async and bound to the event loop it is first used on (the app's
+        background loop); call it from coroutines on that loop.
+
+    Args:
+      builders: Role name -> async builder, e.g. build_workout_agent.
+      size: Agents per role (WORKOUT_AGENT_POOL_SIZE).
+      timeout: Seconds to wait for a busy role (WORKOUT_AGENT_WAIT_TIMEOUT);
+        None waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        builders: Dict[str, AgentBuilder],
+        size: int = AGENT_POOL_SIZE,
+        timeout: Optional[float] = AGENT_WAIT_TIMEOUT,
+    ):
+        self.size = max(1, size)
+        self._roles = {
+            role: _RolePool(build, self.size, timeout) for role, build in builders.items()
+        }
+
+    async def acquire(self, role: str) -> SimpleAgent:
+        return await self._roles[role].acquire()
+
+    async def release(self, role: str, agent: SimpleAgent):
+        self._roles[role].release(agent)
+
+    async def acquire_many(self, roles: Iterable[str]) -> Dict[str, SimpleAgent]:
+        """
+        One agent per role. Roles are taken in one fixed order, so requests
+        that need several never deadlock waiting on each other.
+        """
+        agents: Dict[str, SimpleAgent] = {}
+        try:
+            for role in sorted(set(roles)):
+                agents[role] = await self.acquire(role)
+        except BaseException:
+            await self.release_many(agents)
+            raise
+        return agents
+
+    async def release_many(self, agents: Dict[str, SimpleAgent]):
+        for role, agent in agents.items():
+            await self.release(role, agent)
+
+    @asynccontextmanager
+    async def checkout(self, *roles: str) -> AsyncIterator[Dict[str, SimpleAgent]]:
+        """async with pool.checkout("validator", "safety") as agents: ..."""
+        agents = await self.acquire_many(roles)
+        try:
+            yield agents
+        finally:
+            await self.release_many(agents)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            role: {"created": pool.created, "idle": pool.idle, "size": pool.size}
+            for role, pool in self._roles.items()
+        }
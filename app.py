@@ -1,16 +1,44 @@
-import streamlit as st
 import asyncio
 
+import streamlit as st
+
+from agent_pool import AgentPool
+from background_loop import run_async
+from result_cache import PipelineResultCache, result_key
+from tracing import PipelineTrace
 from workout_agent import build_workout_agent
 from validator_agent import build_validator_agent
 from safety_agent import build_safety_agent
+from workout_pipeline import STAGE_NAMES, build_workout_pipeline
 
 
 # --------------------------
-# Async Helper for Streamlit
+# Agent Pool
 # --------------------------
-def run_async(coro):
-    return asyncio.run(coro)
+AGENT_BUILDERS = {
+    "workout": build_workout_agent,
+    "validator": build_validator_agent,
+    "safety": build_safety_agent,
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_agent_pool() -> AgentPool:
+    """
+    One pool of prebuilt agents per process (WORKOUT_AGENT_POOL_SIZE per role).
+
+    st.cache_resource shares it across reruns and across every user
+    session: each request checks out its own agents, so no conversation
+    state leaks between users, and the LLM adapter, tool registry, executor
+    and planner are only constructed once per role.
+    """
+    return AgentPool(AGENT_BUILDERS)
+
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache() -> PipelineResultCache:
+    """One SQLite-backed result cache connection per process."""
+    return PipelineResultCache()
 
 
 # --------------------------
@@ -71,6 +99,16 @@ extra_instructions = st.sidebar.text_area(
     placeholder="e.g., 'avoid overhead movements', 'focus more on posterior chain', etc."
 )
 
+direct_dispatch = st.sidebar.checkbox(
+    "Fast deterministic planning",
+    value=True,
+    help=(
+        "Call the workout planner and exercise generator tools directly "
+        "instead of through the workout agent. Only validation and safety "
+        "use the LLM."
+    ),
+)
+
 generate_button = st.sidebar.button("🚀 Generate Workout Plan")
 
 
@@ -79,107 +117,138 @@ generate_button = st.sidebar.button("🚀 Generate Workout Plan")
 # ============================================================
 if generate_button:
 
-    with st.spinner("Running multi-agent pipeline..."):
-
-        # --------------------------
-        # Step 0: Build All Agents
-        # --------------------------
-        workout_agent = run_async(build_workout_agent())
-        validator_agent = run_async(build_validator_agent())
-        safety_agent = run_async(build_safety_agent())
-
-        # --------------------------
-        # Step 1: Generate Base Split
-        # --------------------------
-        user_request = (
-            f"Create a {days}-day {goal} workout split. "
-            f"{extra_instructions}"
-        )
-
-        workout_prompt = (
-            "You are a workout-planning agent. The user request is:\n"
-            f"\"{user_request}\"\n\n"
-            "Use ONLY the 'workout_planner' tool.\n"
-            "- Do NOT rewrite or summarize.\n"
-            "- Do NOT add introductory text.\n"
-            "- Do NOT merge days.\n"
-            "- Return ONLY the tool output EXACTLY as produced.\n"
-            "- Keep 'Day 1:', 'Day 2:' structure untouched."
-        )
-
-        plan = run_async(workout_agent.arun(workout_prompt))
-
-    # After spinner ends, show result
-    st.subheader("🏋️ Base Workout Split")
-    st.code(plan, language="text")
+    user_request = (
+        f"Create a {days}-day {goal} workout split. "
+        f"{extra_instructions}"
+    )
 
-    st.markdown("---")
+    inputs = {
+        "user_request": user_request,
+        "days": days,
+        "goal": goal,
+        "extra_instructions": extra_instructions,
+    }
 
     # --------------------------
-    # Step 2: Expand Plan
+    # Step 0: Result Cache, then Pooled Agents
     # --------------------------
-    with st.spinner("Expanding workout into exercises..."):
-
-        expanded_prompt = (
-            "Expand this workout split using ONLY the 'exercise_generator' tool.\n"
-            "RULES:\n"
-            "  - Do NOT add explanations.\n"
-            "  - Do NOT change any text outside exercises.\n"
-            "  - Do NOT remove or alter 'Day 1:' / 'Day 2:' labels.\n"
-            "  - Do NOT add intros like 'Here is your expanded plan'.\n"
-            "  - Only return the tool output.\n\n"
-            f"{plan}"
-        )
-
-        expanded = run_async(workout_agent.arun(expanded_prompt))
-
-    st.subheader("📋 Expanded Plan")
-    st.code(expanded, language="text")
+    # Seeding the inputs with a cached run makes every stage below a no-op,
+    # since the pipeline never re-runs stages it already has; a hit needs no
+    # agents at all, so only a miss waits for the pool.
+    result_cache = get_result_cache()
+    cache_key = result_key(
+        days=days,
+        goal=goal,
+        extra_instructions=extra_instructions,
+        direct_dispatch=direct_dispatch,
+    )
+    cached_results = result_cache.get(cache_key)
+    if cached_results:
+        inputs.update(cached_results)
+
+    trace = PipelineTrace(metadata={
+        "days": days,
+        "goal": goal,
+        "direct_dispatch": direct_dispatch,
+        "cache_hit": bool(cached_results),
+    })
+
+    # Held until the last agent stage finishes, then reset and returned;
+    # when every pooled agent of a role is busy, a miss waits for one.
+    # Acquired inside the try, so a rerun raised while the spinner closes
+    # still hands the agents back.
+    agent_pool = get_agent_pool()
+    agents = {}
+    pipeline = None
+
+    def run_stages(results, targets):
+        if pipeline is None:
+            return results  # served from the result cache
+        return run_async(pipeline.arun(results, targets=targets, trace=trace))
+
+    try:
+        if not cached_results:
+            roles = ("validator", "safety") if direct_dispatch else ("workout", "validator", "safety")
+            with st.spinner("Waiting for a free agent..."):
+                try:
+                    agents = run_async(agent_pool.acquire_many(roles))
+                except asyncio.TimeoutError:
+                    st.error("Every agent is busy right now; please try again in a moment.")
+                    st.stop()
+
+        with st.spinner("Running multi-agent pipeline..."):
+            if agents:
+                pipeline = build_workout_pipeline(
+                    workout_agent=agents.get("workout"),
+                    validator_agent=agents["validator"],
+                    safety_agent=agents["safety"],
+                    direct_dispatch=direct_dispatch,
+                )
+
+            # --------------------------
+            # Step 1: Generate Base Split
+            # --------------------------
+            results = run_stages(inputs, ["plan"])
+            plan = str(results["plan"])
+
+        # After spinner ends, show result
+        st.subheader("🏋️ Base Workout Split")
+        st.code(plan, language="text")
+
+        st.markdown("---")
 
-    st.markdown("---")
+        # --------------------------
+        # Step 2: Expand Plan
+        # --------------------------
+        with st.spinner("Expanding workout into exercises..."):
+            results = run_stages(results, ["expanded"])
+            expanded = str(results["expanded"])
 
-    # --------------------------
-    # Step 3: Validator Agent
-    # --------------------------
-    with st.spinner("Validating muscle coverage and recovery..."):
+        st.subheader("📋 Expanded Plan")
+        st.code(expanded, language="text")
 
-        validator_prompt = (
-            "Evaluate the workout plan below using VALIDATION TOOLS ONLY:\n"
-            "1. Check muscle group coverage\n"
-            "2. Check recovery & sequence balance\n"
-            "3. Summarize any issues found\n\n"
-            f"{expanded}"
-        )
+        st.markdown("---")
 
-        validation = run_async(validator_agent.arun(validator_prompt))
+        # --------------------------
+        # Step 3: Validator + Safety Agents (run concurrently)
+        # --------------------------
+        with st.spinner("Validating muscle coverage, recovery and safety..."):
+            results = run_stages(results, ["validation", "safety"])
+            validation = results["validation"]
+            safety_output = results["safety"]
+    finally:
+        if agents:
+            run_async(agent_pool.release_many(agents))
 
     st.subheader("✅ Validation & Suggestions")
     st.code(validation, language="text")
 
     st.markdown("---")
 
-    # --------------------------
-    # Step 4: Safety Agent
-    # --------------------------
-    with st.spinner("Checking for safety risks..."):
-
-        safety_prompt = (
-            "Use ONLY the 'safety_checker' tool to analyze this workout for:\n"
-            "- Dangerous exercise combinations\n"
-            "- Overuse concerns\n"
-            "- High-risk sequencing\n\n"
-            f"{expanded}"
-        )
-
-        safety_output = run_async(safety_agent.arun(safety_prompt))
-
     st.subheader("⚠️ Safety Notes")
     st.code(safety_output, language="text")
 
     st.markdown("---")
 
+    if cached_results:
+        st.caption("⚡ Served from the result cache.")
+    else:
+        result_cache.put(cache_key, {name: str(results[name]) for name in STAGE_NAMES})
+
+    # --------------------------
+    # Performance Panel
+    # --------------------------
+    trace.write()
+    with st.expander("⏱️ Performance"):
+        if trace.stages:
+            st.write(f"Total stage time: {trace.total_s:.2f}s")
+            st.table(trace.rows())
+        else:
+            st.write("No stages ran — every output came from the result cache.")
+        st.json(trace.to_dict(), expanded=False)
+
     # --------------------------
-    # Step 5: Download Button
+    # Step 4: Download Button
     # --------------------------
     final_output = (
         "=== BASE SPLIT ===\n" + plan +
@@ -0,0 +1,75 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """
+    A single asyncio event loop running forever on a dedicated daemon thread.
+
+    Role:
+      - Gives synchronous callers (Streamlit reruns, CLI code) one place to
+        submit coroutines instead of calling asyncio.run() per stage.
+      - Keeps loop-bound resources alive between calls, e.g. the keep-alive
+        connection pool inside the OpenAI async client, so later stages and
+        later requests reuse open TCP/TLS connections.
+    """
+
+    def __init__(self, name: str = "pipeline-event-loop"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever,
+            name=name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedules `coro` on the loop and returns a thread-safe future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Runs `coro` on the loop and blocks the calling thread for its result."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "BackgroundEventLoop.run() cannot be called from the loop thread; "
+                "await the coroutine instead."
+            )
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        """Stops the loop and waits for its thread to exit."""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._loop.close()
+
+
+_default_loop: Optional[BackgroundEventLoop] = None
+_default_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Returns the process-wide background loop, starting it on first use."""
+    global _default_loop
+    if _default_loop is None:
+        with _default_loop_lock:
+            if _default_loop is None:
+                _default_loop = BackgroundEventLoop()
+    return _default_loop
+
+
+def run_async(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Runs `coro` on the shared background loop and returns its result."""
+    return get_background_loop().run(coro, timeout)
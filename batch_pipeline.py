@@ -0,0 +1,172 @@
+from dotenv import load_dotenv
+load_dotenv()
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional
+
+from fairlib import SimpleAgent
+
+from result_cache import PipelineResultCache, result_key
+from tracing import PipelineTrace
+from workout_agent import build_workout_agent
+from validator_agent import build_validator_agent
+from safety_agent import build_safety_agent
+from jsonl_io import completed_ids, open_output, read_requests
+from workout_pipeline import STAGE_NAMES, build_workout_pipeline, with_fresh_memory
+
+
+# --------------------------
+# Batch Runner
+# --------------------------
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    concurrency: int = 4,
+    overwrite: bool = False,
+    result_cache: Optional[PipelineResultCache] = None,
+) -> Dict[str, int]:
+    """
+    Runs the full plan/expand/validate/safety pipeline for every request in
+    `input_path`, at most `concurrency` at a time.
+
+    Each result is appended to `output_path` as soon as its request finishes.
+    Unless `overwrite` is set, requests already written with status "ok" are
+    skipped, so an interrupted run resumes where it stopped.
+    """
+    skip = set() if overwrite else completed_ids(output_path)
+
+    # Built once; every request gets agents with their own WorkingMemory.
+    base_agents: Dict[str, SimpleAgent] = {
+        "workout": await build_workout_agent(),
+        "validator": await build_validator_agent(),
+        "safety": await build_safety_agent(),
+    }
+
+    stats = {"ok": 0, "error": 0, "skipped": 0, "cached": 0}
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    with open_output(output_path, overwrite) as out:
+
+        def write(record: Dict[str, Any]):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+
+        async def process(request: Dict[str, Any]):
+            started = time.perf_counter()
+            direct = request["days"] is not None
+            key = result_key(
+                days=request["days"],
+                goal=request["goal"],
+                extra_instructions=request["extra_instructions"],
+                direct_dispatch=direct,
+            )
+            cached = result_cache.get(key) if result_cache else None
+
+            record = dict(request)
+            trace = PipelineTrace(request_id=request["id"])
+            try:
+                if cached:
+                    stats["cached"] += 1
+                    results = cached
+                else:
+                    pipeline = build_workout_pipeline(
+                        None if direct else with_fresh_memory(base_agents["workout"]),
+                        with_fresh_memory(base_agents["validator"]),
+                        with_fresh_memory(base_agents["safety"]),
+                        direct_dispatch=direct,
+                    )
+                    results = await pipeline.arun(request, trace=trace)
+                    if result_cache:
+                        result_cache.put(key, {name: str(results[name]) for name in STAGE_NAMES})
+
+                record.update({name: str(results[name]) for name in STAGE_NAMES})
+                record["status"] = "ok"
+                stats["ok"] += 1
+            except Exception as e:
+                record["status"] = "error"
+                record["error"] = f"{type(e).__name__}: {e}"
+                stats["error"] += 1
+
+            record["elapsed_s"] = round(time.perf_counter() - started, 3)
+            record["trace"] = trace.to_dict()["stages"]
+            write(record)
+
+        async def worker():
+            while True:
+                request = await queue.get()
+                try:
+                    if request is None:
+                        return
+                    await process(request)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+
+        # Feeding through a bounded queue keeps memory flat on large inputs.
+        for request in read_requests(input_path):
+            if "error" in request:
+                # Unreadable line: nothing to run, but it still gets a record.
+                write({**request, "status": "error"})
+                stats["error"] += 1
+                continue
+            if request["id"] in skip:
+                stats["skipped"] += 1
+                continue
+            await queue.put(request)
+        for _ in workers:
+            await queue.put(None)
+
+        await asyncio.gather(*workers)
+
+    return stats
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Generate workout plans for every request in a JSONL file."
+    )
+    parser.add_argument("input", help="JSONL file of workout requests")
+    parser.add_argument(
+        "-o", "--output", default="batch_results.jsonl",
+        help="JSONL file results are streamed to (default: batch_results.jsonl)",
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=4,
+        help="maximum number of requests in flight (default: 4)",
+    )
+    parser.add_argument(
+        "--overwrite", action="store_true",
+        help="start over instead of resuming from an existing output file",
+    )
+    parser.add_argument(
+        "--result-cache", metavar="PATH",
+        help="share complete runs through a SQLite result cache at PATH",
+    )
+    args = parser.parse_args()
+
+    result_cache = PipelineResultCache(args.result_cache) if args.result_cache else None
+
+    started = time.perf_counter()
+    stats = await run_batch(
+        args.input,
+        args.output,
+        concurrency=args.concurrency,
+        overwrite=args.overwrite,
+        result_cache=result_cache,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"📦 Batch finished in {elapsed:.1f}s — "
+        f"{stats['ok']} ok ({stats['cached']} from cache), "
+        f"{stats['error']} errors, {stats['skipped']} already done. "
+        f"Results: {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
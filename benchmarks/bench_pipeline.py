@@ -0,0 +1,157 @@
+"""
+End-to-end pipeline benchmark against the offline ScriptedChatModel.
+
+Runs the full plan/expand/validate/safety pipeline many times at several
+concurrency levels and reports throughput and p50/p95/p99 latency. No
+network or API key is needed.
+
+  python benchmarks/bench_pipeline.py
+  python benchmarks/bench_pipeline.py -n 200 -c 1 8 32 --latency uniform:0.1,0.3
+  python benchmarks/bench_pipeline.py --mode direct --json results.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mock_llm import ScriptedChatModel
+from tracing import InstrumentedChatModel, PipelineTrace
+from workout_agent import build_workout_agent
+from validator_agent import build_validator_agent
+from safety_agent import build_safety_agent
+from jsonl_io import parse_workout_request
+from workout_pipeline import build_workout_pipeline, with_fresh_memory
+
+REQUESTS = [
+    "Create a 3-day hypertrophy full body plan",
+    "Create a 4-day strength split",
+    "I want a 5-day hypertrophy program",
+    "Build me a 6-day endurance routine",
+    "Give me a 4-day hypertrophy upper/lower plan",
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_level(agents: Dict[str, Any], mode: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    """Runs `requests` pipelines with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    llm_calls = 0
+    errors = 0
+
+    async def one(i: int):
+        nonlocal llm_calls, errors
+        user_request = REQUESTS[i % len(REQUESTS)]
+        days, goal = parse_workout_request(user_request)
+        direct = mode == "direct"
+        async with semaphore:
+            pipeline = build_workout_pipeline(
+                None if direct else with_fresh_memory(agents["workout"]),
+                with_fresh_memory(agents["validator"]),
+                with_fresh_memory(agents["safety"]),
+                direct_dispatch=direct,
+            )
+            trace = PipelineTrace()
+            started = time.perf_counter()
+            try:
+                await pipeline.arun(
+                    {
+                        "user_request": user_request,
+                        "days": days,
+                        "goal": goal,
+                        "extra_instructions": "",
+                    },
+                    trace=trace,
+                )
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+            llm_calls += sum(s.llm_calls for s in trace.stages.values())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "p50_s": round(percentile(latencies, 50), 3),
+        "p95_s": round(percentile(latencies, 95), 3),
+        "p99_s": round(percentile(latencies, 99), 3),
+        "llm_calls_per_request": round(llm_calls / requests, 2),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the workout pipeline offline.")
+    parser.add_argument("-n", "--requests", type=int, default=50, help="requests per concurrency level (default: 50)")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, nargs="+", default=[1, 4, 16, 64],
+        help="concurrency levels to measure (default: 1 4 16 64)",
+    )
+    parser.add_argument(
+        "--mode", choices=["agent", "direct", "both"], default="both",
+        help="planning stages via the agent, via direct tool dispatch, or both",
+    )
+    parser.add_argument(
+        "--latency", default="lognormal:0.2,0.4",
+        help="simulated LLM latency, see mock_llm.LatencyModel (default: lognormal:0.2,0.4)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="latency RNG seed (default: 0)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON to PATH")
+    args = parser.parse_args()
+
+    # Bypass the shared adapter (and its disk cache): every call hits the mock.
+    llm = InstrumentedChatModel(ScriptedChatModel(latency=args.latency, seed=args.seed))
+    agents = {
+        "workout": await build_workout_agent(llm=llm),
+        "validator": await build_validator_agent(llm=llm),
+        "safety": await build_safety_agent(llm=llm),
+    }
+
+    modes = ["agent", "direct"] if args.mode == "both" else [args.mode]
+    results = []
+    print(f"🏁 {args.requests} requests per level, LLM latency {args.latency}")
+    print(f"{'mode':<7}{'conc':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'LLM/req':>9}{'errors':>8}")
+    for mode in modes:
+        for concurrency in args.concurrency:
+            # SimpleAgent prints every ReAct step; keep the table readable.
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = await run_level(agents, mode, args.requests, concurrency)
+            results.append(result)
+            print(
+                f"{mode:<7}{concurrency:>6}{result['throughput_rps']:>9.2f}"
+                f"{result['p50_s']:>8.3f}s{result['p95_s']:>8.3f}s{result['p99_s']:>8.3f}s"
+                f"{result['llm_calls_per_request']:>9.1f}{result['errors']:>8}"
+            )
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"latency": args.latency, "seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+    asyncio.run(main())
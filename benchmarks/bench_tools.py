@@ -0,0 +1,153 @@
+"""
+Micro-benchmarks for the tools in tools/.
+
+Measures input decoding (the old eval() against decode_tool_input, cold and
+cached), the cost of one use() call per tool, in microseconds, and per-call
+use() against use_batch() over two batches of generated plans: one that
+repeats plans the way generated workloads do (most of the gain there is
+deduplication) and one where every plan text is distinct.
+
+  python benchmarks/bench_tools.py
+  python benchmarks/bench_tools.py --weeks 52 -n 2000 --json tools.json
+  python benchmarks/bench_tools.py --batch 10000
+"""
+import argparse
+import itertools
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.exercise_generator_tool import _DAY_EXERCISES, ExerciseGeneratorTool
+from tools.muscle_coverage_tool import MuscleCoverageValidatorTool
+from tools.plan_parser import parse_plan
+from tools.recovery_balance_tool import RecoveryBalanceTool
+from tools.safety_tool import _DAY_WARNINGS, SafetyCheckTool
+from tools.tool_input import _decode_cached, decode_tool_input
+from tools.volume import _DAY_VOLUME
+from tools.workout_planner_tool import WorkoutPlannerTool
+
+
+def per_call_us(fn: Callable[[], Any], number: int) -> float:
+    """Best-of-3 mean time of fn() in microseconds."""
+    best = min(timeit.repeat(fn, number=number, repeat=3))
+    return best / number * 1e6
+
+
+def cold(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """fn with the decode, parse and per-day caches cleared before every call."""
+    def run():
+        _decode_cached.cache_clear()
+        parse_plan.cache_clear()
+        for day_cache in (_DAY_EXERCISES, _DAY_VOLUME, _DAY_WARNINGS):
+            day_cache.clear()
+        return fn()
+    return run
+
+
+def batch_inputs(planner, generator, size: int, distinct: bool = False) -> Dict[str, List[Any]]:
+    """
+    `size` inputs per tool, cycling through every days × goal × weeks
+    combination, so a batch repeats plans the way generated workloads do.
+
+    With `distinct`, every input is made unique (a "Member N" line ahead of
+    the plan, a member note as planner constraints), so use_batch() cannot
+    deduplicate and only its shared per-day lookups count.
+    """
+    goals = ("strength", "hypertrophy", "endurance")
+    combos = list(itertools.product(range(2, 7), goals, range(1, 5)))
+    plan_args, gen_args, expanded = [], [], []
+    for i, (days, goal, weeks) in enumerate(itertools.islice(itertools.cycle(combos), size)):
+        args = {"days": days, "goal": goal}
+        plan_text = planner.use(repr(args))
+        tag = f"Member {i}\n" if distinct else ""
+        plan_args.append(repr({**args, "constraints": tag.strip()}) if distinct else repr(args))
+        gen_args.append(repr({"plan": tag + plan_text, "goal": goal}))
+        expanded.append(tag + generator.use(gen_args[-1]) * weeks)
+    return {"plan_args": plan_args, "gen_args": gen_args, "expanded": expanded}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tool input decoding and tool calls.")
+    parser.add_argument("-n", "--number", type=int, default=1000, help="calls per measurement (default: 1000)")
+    parser.add_argument("--weeks", type=int, default=1, help="length of the expanded plan in weeks (default: 1)")
+    parser.add_argument("--batch", type=int, default=1000, help="plans per batch for use_batch() (default: 1000)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON to PATH")
+    args = parser.parse_args()
+
+    planner = WorkoutPlannerTool()
+    generator = ExerciseGeneratorTool()
+    validators = [MuscleCoverageValidatorTool(), RecoveryBalanceTool(), SafetyCheckTool()]
+
+    plan_args = {"days": 5, "goal": "strength"}
+    plan_text = planner.use(repr(plan_args))
+    expanded = generator.use(repr({"plan": plan_text, "goal": "strength"})) * args.weeks
+    generator_args = {"plan": plan_text, "goal": "strength"}
+
+    results: List[Dict[str, Any]] = []
+
+    def record(section: str, name: str, fn: Callable[[], Any]):
+        us = per_call_us(fn, args.number)
+        results.append({"section": section, "name": name, "us_per_call": round(us, 3)})
+        print(f"  {name:<44}{us:>10.2f} µs")
+
+    print(f"⏱️  {args.number} calls per measurement, expanded plan: {args.weeks} week(s)")
+
+    print("\nInput decoding:")
+    for label, data in (("planner", plan_args), ("generator", generator_args)):
+        literal, as_json = repr(data), json.dumps(data)
+        schema = (planner if label == "planner" else generator).input_schema
+        record("decode", f"{label}: eval() (old)", lambda s=literal: eval(s))
+        record("decode", f"{label}: dict literal, cold", cold(lambda s=literal: decode_tool_input(s, schema)))
+        record("decode", f"{label}: JSON, cold", cold(lambda s=as_json: decode_tool_input(s, schema)))
+        record("decode", f"{label}: cached", lambda s=literal: decode_tool_input(s, schema))
+
+    print("\nTool calls (warm caches):")
+    record("tools", planner.name, lambda: planner.use(repr(plan_args)))
+    record("tools", generator.name, lambda: generator.use(repr(generator_args)))
+    for tool in validators:
+        record("tools", tool.name, lambda t=tool: t.use(expanded))
+
+    print("\nTool calls (cold caches):")
+    for tool in validators:
+        record("tools-cold", tool.name, cold(lambda t=tool: t.use(expanded)))
+
+    batches = (
+        ("batch", "repeating plans", False),
+        ("batch-distinct", "distinct plans", True),
+    )
+    for section, label, distinct in batches:
+        print(f"\nBatch of {args.batch} {label}, cold caches (µs per plan):")
+        batch = batch_inputs(planner, generator, args.batch, distinct=distinct)
+        tool_inputs = [
+            (planner, batch["plan_args"]),
+            (generator, batch["gen_args"]),
+        ] + [(tool, batch["expanded"]) for tool in validators]
+        for tool, inputs in tool_inputs:
+            per_call = min(timeit.repeat(cold(lambda t=tool, x=inputs: [t.use(i) for i in x]), number=1, repeat=3))
+            batched = min(timeit.repeat(cold(lambda t=tool, x=inputs: t.use_batch(x)), number=1, repeat=3))
+            per_call_us_plan = per_call / len(inputs) * 1e6
+            batch_us_plan = batched / len(inputs) * 1e6
+            results.append({
+                "section": section,
+                "name": tool.name,
+                "batch_size": len(inputs),
+                "use_us_per_plan": round(per_call_us_plan, 3),
+                "use_batch_us_per_plan": round(batch_us_plan, 3),
+            })
+            print(
+                f"  {tool.name:<28}use() {per_call_us_plan:>9.2f}   "
+                f"use_batch() {batch_us_plan:>9.2f}   ×{per_call / batched:.1f}"
+            )
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"weeks": args.weeks, "number": args.number, "batch": args.batch, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import os
+from collections import deque
+from dataclasses import replace
+from typing import Deque, List, Optional, Tuple
+
+from fairlib import WorkingMemory
+from fairlib.core.message import Message
+
+from tracing import count_tokens
+
+# Prompt history budget per agent, in tokens (tiktoken if installed, else
+# ~4 chars/token), and a hard cap on stored messages.
+MEMORY_TOKEN_BUDGET = int(os.getenv("WORKOUT_MEMORY_TOKEN_BUDGET", 4000))
+MEMORY_MAX_MESSAGES = int(os.getenv("WORKOUT_MEMORY_MAX_MESSAGES", 40))
+
+# Earlier requests named in the summary line, and characters kept of each.
+SUMMARY_REQUESTS = 5
+SUMMARY_CHARS = 80
+
+_TRUNCATED = "\n… [truncated to fit the memory budget] …\n"
+
+
+class BoundedMemory(WorkingMemory):
+    """
+    WorkingMemory with a token budget, for agents that live as long as a
+    REPL session.
+
+    Role:
+      - Messages sit in a ring buffer with their token counts. Once the
+        history exceeds `token_budget` (or `max_messages`), the oldest
+        messages of earlier requests are dropped first.
+      - Dropped requests are folded into one short summary message ("Earlier
+        this session: ...") at the head of the history, so the agent keeps
+        the gist while the prompt stays flat.
+      - The current request is never dropped, since the agent re-reads it
+        every step. If it alone exceeds the budget, its longest messages
+        (typically tool observations) are cut in the middle instead.
+      - SimpleAgent(stateless=True) remains the way to reset every request.
+
+    Args:
+      token_budget: Tokens the history may hold, summary included.
+      max_messages: Messages the history may hold.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = MEMORY_TOKEN_BUDGET,
+        max_messages: int = MEMORY_MAX_MESSAGES,
+    ):
+        # Not WorkingMemory.__init__: the history lives in the ring buffer.
+        self.max_size = max_messages
+        self.token_budget = token_budget
+        self.max_messages = max_messages
+        self._messages: Deque[Tuple[Message, int]] = deque()
+        self._tokens = 0
+        self._current = 0  # messages that belong to the current request
+        self._earlier: Deque[str] = deque(maxlen=SUMMARY_REQUESTS)
+        self._dropped_requests = 0
+        self._summary: Optional[Tuple[Message, int]] = None
+
+    @property
+    def history(self) -> List[Message]:
+        return self.get_history()
+
+    @property
+    def tokens(self) -> int:
+        """Tokens in the history get_history() returns."""
+        return self._tokens + (self._summary[1] if self._summary else 0)
+
+    def add_message(self, message: Message):
+        if message.role == "user":
+            self._current = 0
+        self._messages.append((message, count_tokens(message.content or "")))
+        self._tokens += self._messages[-1][1]
+        self._current += 1
+        self._trim()
+
+    def get_history(self) -> List[Message]:
+        history = [message for message, _ in self._messages]
+        if self._summary is not None:
+            history.insert(0, self._summary[0])
+        return history
+
+    def clear(self):
+        self._messages.clear()
+        self._tokens = 0
+        self._current = 0
+        self._earlier.clear()
+        self._dropped_requests = 0
+        self._summary = None
+
+    # --------------------------
+    # Trimming
+    # --------------------------
+    def _over(self) -> bool:
+        return self.tokens > self.token_budget or len(self._messages) > self.max_messages
+
+    def _trim(self):
+        dropped = False
+        while self._over() and len(self._messages) > self._current:
+            message, tokens = self._messages.popleft()
+            self._tokens -= tokens
+            if message.role == "user":
+                self._earlier.append(" ".join((message.content or "").split())[:SUMMARY_CHARS])
+                self._dropped_requests += 1
+            dropped = True
+        if dropped or (self._summary is not None and self._over()):
+            self._summarize()
+        if self._over():
+            self._shrink_current()
+
+    def _summarize(self):
+        # The summary has to fit in the budget too; it names fewer earlier
+        # requests until it does, and is left out if none fit.
+        self._summary = None
+        while self._earlier:
+            shown = "; ".join(f'"{text}"' for text in self._earlier)
+            content = (
+                f"Earlier this session ({self._dropped_requests} requests, details "
+                f"dropped to save context), most recently: {shown}"
+            )
+            tokens = count_tokens(content)
+            if self._tokens + tokens <= self.token_budget:
+                self._summary = (Message(role="system", content=content), tokens)
+                return
+            self._earlier.popleft()
+
+    def _shrink_current(self):
+        # Cut the largest non-user messages down until the budget holds.
+        while self._over():
+            excess = self.tokens - self.token_budget
+            candidates = [
+                (tokens, i) for i, (message, tokens) in enumerate(self._messages)
+                if message.role != "user" and tokens > 1
+            ]
+            if not candidates or excess <= 0:
+                return
+            tokens, i = max(candidates)
+            message, _ = self._messages[i]
+            content = message.content or ""
+            keep = max(0, len(content) * max(tokens - excess, 0) // tokens - len(_TRUNCATED))
+            shortened = content[: keep // 2] + _TRUNCATED + content[len(content) - keep // 2:]
+            if len(shortened) >= len(content):
+                return
+            new_tokens = count_tokens(shortened)
+            self._messages[i] = (replace(message, content=shortened), new_tokens)
+            self._tokens += new_tokens - tokens
@@ -0,0 +1,130 @@
+import argparse
+import json
+import time
+from typing import Dict
+
+from jsonl_io import open_output, read_requests
+from tools.day_cache import DayCache
+from tools.muscle_coverage_tool import MuscleCoverageValidatorTool
+from tools.periodization import DELOAD_EVERY, PERIODIZATION_MODELS, validate_weeks
+from tools.recovery_balance_tool import RecoveryBalanceTool
+from tools.safety_tool import SafetyCheckTool
+from tools.tool_input import ToolInputError
+from tools.workout_planner_tool import WorkoutPlannerTool
+
+
+# --------------------------
+# Program Export
+# --------------------------
+def export_programs(
+    input_path: str,
+    output_path: str,
+    weeks: int = 52,
+    model: str = "linear",
+    deload_every: int = DELOAD_EVERY,
+    validate: bool = True,
+) -> Dict[str, int]:
+    """
+    Writes a periodized program for every request in `input_path` (the
+    JSONL format batch_pipeline.py reads) to `output_path`, one JSONL record
+    per member and week: {"id", "week", "phase", "plan", <validator reports>}.
+
+    Role:
+      - Requests are read, planned and written one at a time, and each
+        program is a lazy stream of weeks, so memory stays flat for any
+        number of members and weeks.
+      - Plans come straight from the planner and generator tools (no LLM);
+        requests without a day count get the planner's default, and ones
+        it rejects (e.g. 10 days) or lines that are not valid JSON get a
+        single {"id", "error"} record.
+    """
+    planner = WorkoutPlannerTool()
+    tools = (
+        [MuscleCoverageValidatorTool(), RecoveryBalanceTool(), SafetyCheckTool()]
+        if validate else []
+    )
+    report_cache = DayCache()  # shared by every member: same tools throughout
+    stats = {"members": 0, "weeks": 0, "errors": 0}
+
+    with open_output(output_path, overwrite=True) as out:
+        for request in read_requests(input_path):
+            if "error" in request:
+                # Unreadable JSONL line; reported under its line number.
+                out.write(json.dumps(request) + "\n")
+                stats["errors"] += 1
+                continue
+            try:
+                program = planner.build_weeks(
+                    request["days"] or 3,
+                    request["goal"],
+                    weeks,
+                    model,
+                    constraints=request["extra_instructions"],
+                    deload_every=deload_every,
+                )
+            except ToolInputError as e:
+                # e.g. more training days than a week has; the rest go on.
+                out.write(json.dumps({"id": request["id"], "error": str(e)}) + "\n")
+                stats["errors"] += 1
+                continue
+            for week, reports in validate_weeks(program, tools, cache=report_cache):
+                record = {
+                    "id": request["id"],
+                    "week": week.number,
+                    "phase": week.phase,
+                    "plan": str(week.plan),
+                    **reports,
+                }
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                stats["weeks"] += 1
+            stats["members"] += 1
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export periodized multi-week programs for every request in a JSONL file."
+    )
+    parser.add_argument("input", help="JSONL file of workout requests")
+    parser.add_argument(
+        "-o", "--output", default="programs.jsonl",
+        help="JSONL file weeks are streamed to (default: programs.jsonl)",
+    )
+    parser.add_argument(
+        "--weeks", type=int, default=52,
+        help="weeks per program (default: 52)",
+    )
+    parser.add_argument(
+        "--model", choices=sorted(PERIODIZATION_MODELS), default="linear",
+        help="periodization model (default: linear)",
+    )
+    parser.add_argument(
+        "--deload-every", type=int, default=DELOAD_EVERY,
+        help=f"weeks per mesocycle, the last one a deload; 0 for none (default: {DELOAD_EVERY})",
+    )
+    parser.add_argument(
+        "--no-validate", action="store_true",
+        help="skip the coverage, recovery and safety reports",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = export_programs(
+        args.input,
+        args.output,
+        weeks=args.weeks,
+        model=args.model,
+        deload_every=args.deload_every,
+        validate=not args.no_validate,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"📅 Exported {stats['members']} programs ({stats['weeks']} weeks, "
+        f"{stats['errors']} errors) in {elapsed:.1f}s. Programs: {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+# JSONL helpers shared by batch_pipeline.py, validate_corpus.py and
+# export_programs.py. Standard library only, so the scripts that never call
+# an LLM (and their worker processes) skip fairlib, the LLM adapter, the
+# agent builders and .env loading.
+
+
+# --------------------------
+# Request Parsing
+# --------------------------
+def parse_workout_request(text: str) -> Tuple[Optional[int], str]:
+    """
+    Infers (days, goal) from a free-text request with simple keyword checks.
+
+    days is None when the request does not state a day count; goal defaults
+    to hypertrophy.
+    """
+    lowered = text.lower()
+    if "strength" in lowered:
+        goal = "strength"
+    elif "endurance" in lowered:
+        goal = "endurance"
+    else:
+        goal = "hypertrophy"
+
+    days_match = re.search(r"(\d+)[\s-]*day", lowered)
+    days = int(days_match.group(1)) if days_match else None
+    return days, goal
+
+
+# --------------------------
+# Input / Output Helpers
+# --------------------------
+def _normalize_request(record: Any, line_no: int) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ValueError(f"expected a JSON object, got {type(record).__name__}")
+
+    request_id = str(record.get("request_id") or record.get("id") or line_no)
+    text = next(
+        (
+            record[field]
+            for field in ("user_request", "request", "body", "title")
+            if record.get(field)
+        ),
+        "",
+    )
+    days, goal = parse_workout_request(str(text))
+    if record.get("days") is not None:
+        days = int(record["days"])
+    goal = record.get("goal") or goal
+    extra = record.get("extra_instructions", "")
+    if not text:
+        text = f"Create a {days}-day {goal} workout split. {extra}".strip()
+
+    return {
+        "id": request_id,
+        "user_request": str(text),
+        "days": days,
+        "goal": goal,
+        "extra_instructions": extra,
+    }
+
+
+def read_requests(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one normalized request per non-empty JSONL line.
+
+    Each line may give the request as structured fields
+    ({"days": 4, "goal": "strength", "extra_instructions": "..."}) or as free
+    text under "user_request", "request", "body" or "title". The id is taken
+    from "request_id" or "id", falling back to the line number.
+
+    A line that cannot be read as a request (invalid JSON, not an object,
+    or e.g. "days": "three") yields {"id": ..., "error": ...} instead, so one
+    bad line is reported without aborting the batch.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = None
+            try:
+                record = json.loads(line)
+                request = _normalize_request(record, line_no)
+            except (ValueError, TypeError) as e:
+                # JSONDecodeError is a ValueError, as is int("three").
+                known = record if isinstance(record, dict) else {}
+                request_id = known.get("request_id") or known.get("id") or line_no
+                yield {"id": str(request_id), "error": f"{type(e).__name__}: {e}"}
+                continue
+            yield request
+
+
+def completed_ids(path: str) -> Set[str]:
+    """Ids already written with status "ok" by an earlier (partial) run."""
+    done: Set[str] = set()
+    if not Path(path).exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write leaves a truncated last line; that
+                # request simply runs again.
+                continue
+            if record.get("status") == "ok":
+                done.add(str(record["id"]))
+    return done
+
+
+def open_output(path: str, overwrite: bool):
+    """Opens the output for appending, starting on a fresh line."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if overwrite or not Path(path).exists():
+        return open(path, "w", encoding="utf-8")
+
+    needs_newline = False
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        if f.tell() > 0:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b"\n"
+
+    out = open(path, "a", encoding="utf-8")
+    if needs_newline:
+        out.write("\n")
+    return out
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from fairlib.core.interfaces.llm import AbstractChatModel
+from fairlib.core.message import Message
+
+from result_cache import is_failure_output
+from sqlite_cache import SQLiteLRUCache
+
+DEFAULT_LLM_CACHE_PATH = os.getenv(
+    "WORKOUT_LLM_CACHE_PATH", str(Path(".cache") / "llm_responses.sqlite")
+)
+DEFAULT_LLM_CACHE_MAX_BYTES = int(
+    os.getenv("WORKOUT_LLM_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)
+LLM_CACHE_ENABLED = os.getenv("WORKOUT_LLM_CACHE_ENABLED", "1") != "0"
+
+
+def _jsonable(value: Any) -> Any:
+    """Plain-JSON form of tool_calls, which may be OpenAI pydantic objects."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    return value
+
+
+def request_key(model_name: str, messages: List[Message], **kwargs: Any) -> str:
+    """Hash of everything that determines a completion: model, messages, sampling."""
+    payload = {
+        "model": model_name,
+        "messages": [
+            {
+                "role": m.role,
+                "content": m.content or "",
+                "name": m.name,
+                "tool_calls": _jsonable(m.tool_calls),
+                "tool_call_id": m.tool_call_id,
+            }
+            for m in messages
+        ],
+        "params": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CachingChatModel(AbstractChatModel):
+    """
+    Wraps a chat model and serves repeated requests from a disk cache.
+
+    Role:
+      - Keys each invoke()/ainvoke() on a hash of (model, messages, sampling
+        parameters), so byte-for-byte repeats of a prompt (the fixed validator
+        prompt on a plan seen before, etc.) never pay for the same call twice.
+      - Stores completions in a SQLite file with size-based LRU eviction,
+        shared by every process pointed at the same path.
+      - Counts hits and misses; cached responses carry
+        metadata["cache_hit"] = True so tracing can tell them apart.
+
+    Streaming calls pass straight through to the wrapped model.
+    """
+
+    def __init__(
+        self,
+        inner: AbstractChatModel,
+        path: str = DEFAULT_LLM_CACHE_PATH,
+        max_bytes: int = DEFAULT_LLM_CACHE_MAX_BYTES,
+    ):
+        self.inner = inner
+        self.store = SQLiteLRUCache(
+            path,
+            table="llm_responses",
+            max_entries=2**62,
+            max_bytes=max_bytes,
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.inner, "model_name", type(self.inner).__name__)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.store),
+        }
+
+    def _lookup(self, key: str) -> Optional[Message]:
+        cached = self.store.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Message(
+            role="assistant",
+            content=cached["content"],
+            tool_calls=cached["tool_calls"],
+            metadata={"cache_hit": True},
+        )
+
+    def _save(self, key: str, response: Message):
+        # OpenAIAdapter reports API failures as an "Error: ..." message
+        # instead of raising; those must never be replayed from the cache.
+        if not response.tool_calls and is_failure_output(response.content or ""):
+            return
+        self.store.put(key, {
+            "content": response.content,
+            "tool_calls": _jsonable(response.tool_calls),
+        })
+
+    def invoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        key = request_key(self.model_name, messages, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = self.inner.invoke(messages, **kwargs)
+        self._save(key, response)
+        return response
+
+    async def ainvoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        key = request_key(self.model_name, messages, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await self.inner.ainvoke(messages, **kwargs)
+        self._save(key, response)
+        return response
+
+    def stream(self, messages: List[Message], **kwargs: Any) -> Iterator[Message]:
+        return self.inner.stream(messages, **kwargs)
+
+    def astream(self, messages: List[Message], **kwargs: Any) -> AsyncIterator[Message]:
+        return self.inner.astream(messages, **kwargs)
+
+    def get_model_capabilities(self) -> Dict[str, Any]:
+        return self.inner.get_model_capabilities()
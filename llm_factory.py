@@ -0,0 +1,118 @@
+import os
+import threading
+from typing import Iterable, Optional
+
+from fairlib import ReActPlanner, SimpleAgent, ToolRegistry
+from fairlib.core.interfaces.llm import AbstractChatModel
+from fairlib.core.interfaces.tools import AbstractTool
+from fairlib.modules.mal.openai_adapter import OpenAIAdapter
+
+from bounded_memory import BoundedMemory
+from llm_cache import LLM_CACHE_ENABLED, CachingChatModel
+from tools.async_tool import AsyncTool
+from tracing import InstrumentedChatModel, InstrumentedToolExecutor
+
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("WORKOUT_LLM_MAX_CONNECTIONS", 20))
+DEFAULT_MAX_KEEPALIVE = int(os.getenv("WORKOUT_LLM_MAX_KEEPALIVE", 10))
+LLM_BACKEND = os.getenv("WORKOUT_LLM_BACKEND", "openai")
+MOCK_LATENCY = os.getenv("WORKOUT_MOCK_LATENCY", "lognormal:0.5,0.4")
+
+
+def build_llm(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+    use_cache: bool = LLM_CACHE_ENABLED,
+) -> AbstractChatModel:
+    """
+    Builds an instrumented OpenAIAdapter whose HTTP clients use one tunable
+    connection pool each (sync and async).
+
+    With `use_cache` (on unless WORKOUT_LLM_CACHE_ENABLED=0) the adapter is
+    wrapped in a CachingChatModel, so repeated prompts are served from disk.
+
+    Uses model & keys from your .env / env vars, like OpenAIAdapter().
+    With WORKOUT_LLM_BACKEND=mock, returns an instrumented offline
+    ScriptedChatModel instead (no network, no cache).
+    """
+    if LLM_BACKEND == "mock":
+        from mock_llm import ScriptedChatModel
+
+        return InstrumentedChatModel(ScriptedChatModel(latency=MOCK_LATENCY))
+
+    adapter = OpenAIAdapter()
+
+    # OpenAIAdapter creates clients with the library's default pool; swap in
+    # clients with explicit limits. httpx ships with the openai package.
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    api_key = adapter.async_client.api_key
+    adapter.sync_client = OpenAI(
+        api_key=api_key, http_client=httpx.Client(limits=limits)
+    )
+    adapter.async_client = AsyncOpenAI(
+        api_key=api_key, http_client=httpx.AsyncClient(limits=limits)
+    )
+
+    llm: AbstractChatModel = adapter
+    if use_cache:
+        llm = CachingChatModel(llm)
+    return InstrumentedChatModel(llm)
+
+
+_shared_llm: Optional[AbstractChatModel] = None
+_shared_llm_lock = threading.Lock()
+
+
+def get_shared_llm() -> AbstractChatModel:
+    """
+    Returns the process-wide LLM used by every agent builder.
+
+    All agents share one client and so one connection pool to the endpoint.
+    The async client's pool belongs to the event loop it is first used on,
+    so drive every agent from one loop (see background_loop.py).
+    """
+    global _shared_llm
+    if _shared_llm is None:
+        with _shared_llm_lock:
+            if _shared_llm is None:
+                _shared_llm = build_llm()
+    return _shared_llm
+
+
+def build_react_agent(
+    tools: Iterable[AbstractTool], llm: Optional[AbstractChatModel] = None
+) -> SimpleAgent:
+    """
+    The setup every agent builder shares: a ReAct agent over `tools`.
+
+    Role:
+      - Uses the process-wide shared LLM unless `llm` is given, so all agents
+        share one client and connection pool.
+      - Wraps each tool in AsyncTool, so tool calls run on the shared tool
+        pool (WORKOUT_TOOL_EXECUTOR), off the event loop, and are traced.
+      - Gives the agent a BoundedMemory: token-budgeted, so long sessions
+        keep prompts flat.
+      - Drops the planner's date context. The default prompt embeds the
+        current timestamp, which makes every prompt unique and defeats the
+        LLM response cache; no agent here needs it.
+    """
+    llm = llm or get_shared_llm()
+
+    registry = ToolRegistry()
+    for tool in tools:
+        registry.register_tool(AsyncTool(tool))
+
+    planner = ReActPlanner(llm, registry)
+    planner.prompt_builder.date_context = None
+
+    return SimpleAgent(
+        llm=llm,
+        planner=planner,
+        tool_executor=InstrumentedToolExecutor(registry),
+        memory=BoundedMemory(),
+    )
@@ -6,6 +6,9 @@ import asyncio
 from workout_agent import build_workout_agent
 from validator_agent import build_validator_agent
 from safety_agent import build_safety_agent
+from tracing import PipelineTrace
+from jsonl_io import parse_workout_request
+from workout_pipeline import build_workout_pipeline
 
 
 async def main():
@@ -13,6 +16,10 @@ async def main():
     workout_agent = await build_workout_agent()
     validator_agent = await build_validator_agent()
     safety_agent = await build_safety_agent()
+    agent_pipeline = build_workout_pipeline(workout_agent, validator_agent, safety_agent)
+    direct_pipeline = build_workout_pipeline(
+        None, validator_agent, safety_agent, direct_dispatch=True
+    )
 
     print(
         "💪 Multi-Agent Workout System Ready.\n"
@@ -29,67 +36,55 @@ async def main():
         if user_input.lower() == "quit":
             break
 
-        # Infer goal from user_input (very simple keyword check)
-        if "strength" in user_input.lower():
-            goal = "strength"
-        elif "endurance" in user_input.lower():
-            goal = "endurance"
+        # When the day count is explicit we already know every tool argument,
+        # so planning and expansion can skip the workout agent entirely.
+        days, goal = parse_workout_request(user_input)
+        if days is not None:
+            pipeline = direct_pipeline
+            # The REPL has no separate constraints field, and free text is
+            # not read as split constraints (see tools/split_optimizer.py).
+            inputs = {
+                "user_request": user_input,
+                "days": days,
+                "goal": goal,
+                "extra_instructions": "",
+            }
         else:
-            goal = "hypertrophy"   # default
-
-        # --- Step 1: Workout Agent generates the plan ---
-        workout_prompt = (
-            "You are a workout-planning agent. The user request is:\n"
-            f"\"{user_input}\"\n\n"
-            "Use the 'workout_planner' tool to create a concrete plan. "
-            "Return ONLY the exact workout plan produced by the tool. "
-            "Do NOT reword, summarize, remove labels, combine days, or alter formatting. "
-            "Preserve the exact Day 1 / Day 2 / Day 3 structure."
+            pipeline = agent_pipeline
+            inputs = {"user_request": user_input}
 
-        )
+        trace = PipelineTrace(metadata={"user_request": user_input})
 
-        plan = await workout_agent.arun(workout_prompt)
+        # --- Step 1: Workout Agent generates the plan ---
+        results = await pipeline.arun(inputs, targets=["plan"], trace=trace)
         print("\n🏋️ Generated Workout Plan:\n")
-        print(plan)
+        print(results["plan"])
 
         # --- Step 1b: Expand the plan ---
-        expanded_prompt = (
-            "You must use ONLY the 'exercise_generator' tool. "
-            "Do not write explanations. Do not change formatting. "
-            "Do not add introductory text. Do not remove day labels. "
-            "Take the workout plan EXACTLY as shown below and expand each day.\n\n"
-            f"{plan}"
-        )
-
-
-        expanded = await workout_agent.arun(expanded_prompt)
-
+        results = await pipeline.arun(results, targets=["expanded"], trace=trace)
         print("\n📋 Expanded Workout Plan:\n")
-        print(expanded)
+        print(results["expanded"])
 
-        # --- Step 2: Validator Agent critiques the plan ---
-        validator_prompt = (
-            "You are a validation agent. Given the expanded workout plan below, use your "
-            "tools to check (1) muscle group coverage and (2) recovery / balance. "
-            "Then provide a short summary of issues and suggestions.\n\n"
-            f"WORKOUT PLAN:\n{expanded}"
+        # --- Steps 2 & 3: Validator and Safety Agents run concurrently ---
+        results = await pipeline.arun(
+            results, targets=["validation", "safety"], trace=trace
         )
-
-        validation = await validator_agent.arun(validator_prompt)
         print("\n✅ Validation & Suggestions:\n")
-        print(validation)
-
-        # --- Step 3: Safety Agent analyzes the plan ---
-        safety_prompt = (
-            "You are a safety-focused trainer. Use the 'safety_checker' tool to look for "
-            "simple red flags and overuse risks in this workout plan. Then give a short "
-            "summary of your findings with a clear disclaimer.\n\n"
-            f"{expanded}"
-        )
+        print(results["validation"])
 
-        safety_report = await safety_agent.arun(safety_prompt)
         print("\n⚠️  Safety Notes:\n")
-        print(safety_report)
+        print(results["safety"])
+
+        # --- Per-stage timings ---
+        trace.write()
+        print("\n⏱️  Performance:")
+        for row in trace.rows():
+            print(
+                f"  {row['stage']:<11} {row['wall (s)']:>7.2f}s  "
+                f"LLM calls: {row['LLM calls']} ({row['LLM cache hits']} cached)  "
+                f"tokens: {row['prompt tok']}/{row['completion tok']}  "
+                f"tool: {row['tool (s)']:.4f}s"
+            )
 
 if __name__ == "__main__":
     asyncio.run(main())
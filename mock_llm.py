@@ -0,0 +1,185 @@
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fairlib.core.interfaces.llm import AbstractChatModel
+from fairlib.core.message import Message
+
+from jsonl_io import parse_workout_request
+
+OBSERVATION_PREFIX = "Observation: "
+
+
+# ============================
+# Latency Distributions
+# ============================
+class LatencyModel:
+    """
+    Samples simulated LLM response times, in seconds.
+
+    Specs:
+      - "constant:0.4"           always 0.4s
+      - "uniform:0.2,0.8"        uniform between 0.2s and 0.8s
+      - "normal:0.5,0.1"         mean 0.5s, std 0.1s (clipped at 0)
+      - "lognormal:0.5,0.4"      median 0.5s, sigma 0.4 (long right tail,
+                                 closest to real API latencies)
+    """
+
+    KINDS = ("constant", "uniform", "normal", "lognormal")
+
+    def __init__(self, kind: str = "constant", params: Tuple[float, ...] = (0.0,), seed: Optional[int] = None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}'. Use one of {self.KINDS}.")
+        self.kind = kind
+        self.params = params
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def from_spec(cls, spec: str, seed: Optional[int] = None) -> "LatencyModel":
+        kind, _, raw = spec.partition(":")
+        params = tuple(float(p) for p in raw.split(",") if p.strip()) or (0.0,)
+        return cls(kind.strip(), params, seed=seed)
+
+    def sample(self) -> float:
+        if self.kind == "constant":
+            return self.params[0]
+        if self.kind == "uniform":
+            return self._rng.uniform(self.params[0], self.params[1])
+        if self.kind == "normal":
+            return max(0.0, self._rng.gauss(self.params[0], self.params[1]))
+        median, sigma = self.params
+        return self._rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+
+# ============================
+# Default Tool Inputs
+# ============================
+def _request_payload(request: str) -> str:
+    """The data part of a stage prompt: everything after the first blank line."""
+    _, sep, payload = request.partition("\n\n")
+    return payload if sep else request
+
+
+def _workout_planner_input(request: str) -> str:
+    days, goal = parse_workout_request(request)
+    return repr({"days": days or 3, "goal": goal})
+
+
+def _exercise_generator_input(request: str) -> str:
+    payload = _request_payload(request)
+    start = payload.find("Workout Plan")
+    plan = payload[start:] if start >= 0 else payload
+    goal_match = re.search(r"goal:\s*(\w+)", plan, re.IGNORECASE)
+    goal = goal_match.group(1).lower() if goal_match else "hypertrophy"
+    return repr({"plan": plan, "goal": goal})
+
+
+DEFAULT_TOOL_INPUTS: Dict[str, Callable[[str], str]] = {
+    "workout_planner": _workout_planner_input,
+    "exercise_generator": _exercise_generator_input,
+}
+
+
+# ============================
+# Scripted Chat Model
+# ============================
+class ScriptedChatModel(AbstractChatModel):
+    """
+    An offline chat model that behaves like a well-behaved ReAct LLM.
+
+    Role:
+      - Reads the available tools from the ReActPlanner system prompt.
+      - Calls every tool the user request names (or every tool, if none is
+        named), one per step, emitting the planner's JSON action format.
+      - Answers with the collected observations via 'final_answer'.
+      - Sleeps for a latency drawn from a LatencyModel, so the pipeline can be
+        benchmarked without any network.
+
+    Plugs into the same builders as the real adapter, e.g.
+    build_validator_agent(llm=ScriptedChatModel("lognormal:0.5,0.4")).
+    """
+
+    def __init__(
+        self,
+        latency: str = "constant:0",
+        seed: Optional[int] = None,
+        tool_inputs: Optional[Dict[str, Callable[[str], str]]] = None,
+        model_name: str = "scripted-mock",
+    ):
+        self.latency = LatencyModel.from_spec(latency, seed=seed)
+        self.tool_inputs = {**DEFAULT_TOOL_INPUTS, **(tool_inputs or {})}
+        self.model_name = model_name
+        self.calls = 0
+
+    @staticmethod
+    def _available_tools(messages: List[Message]) -> List[str]:
+        system = next((m.content for m in messages if m.role == "system"), "") or ""
+        _, _, section = system.partition("# --- Available Tools ---\n")
+        tools = []
+        for line in section.splitlines():
+            if not line.startswith("- "):
+                break
+            name = line[2:].split(":", 1)[0].strip()
+            if name != "final_answer":
+                tools.append(name)
+        return tools
+
+    def _respond(self, messages: List[Message]) -> str:
+        self.calls += 1
+
+        last_user = max(
+            (i for i, m in enumerate(messages) if m.role == "user"), default=-1
+        )
+        request = messages[last_user].content if last_user >= 0 else ""
+
+        # Tools already used and observations received in this turn.
+        called, observations = set(), []
+        for m in messages[last_user + 1:]:
+            content = m.content or ""
+            if m.role == "assistant":
+                try:
+                    called.add(json.loads(content)["action"]["tool_name"])
+                except (ValueError, KeyError, TypeError):
+                    pass
+            elif m.role == "system" and content.startswith(OBSERVATION_PREFIX):
+                observations.append(content[len(OBSERVATION_PREFIX):])
+
+        tools = self._available_tools(messages)
+        wanted = [t for t in tools if t in request] or tools
+        remaining = [t for t in wanted if t not in called]
+
+        if remaining:
+            tool = remaining[0]
+            make_input = self.tool_inputs.get(tool, _request_payload)
+            action = {"tool_name": tool, "tool_input": make_input(request)}
+            thought = f"I should use the '{tool}' tool."
+        else:
+            action = {"tool_name": "final_answer", "tool_input": "\n\n".join(observations)}
+            thought = "I have everything I need to answer."
+
+        return json.dumps({"thought": thought, "action": action})
+
+    def invoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        time.sleep(self.latency.sample())
+        return Message(role="assistant", content=self._respond(messages))
+
+    async def ainvoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        await asyncio.sleep(self.latency.sample())
+        return Message(role="assistant", content=self._respond(messages))
+
+    def stream(self, messages: List[Message], **kwargs: Any) -> Iterator[Message]:
+        yield self.invoke(messages, **kwargs)
+
+    async def astream(self, messages: List[Message], **kwargs: Any) -> AsyncIterator[Message]:
+        yield await self.ainvoke(messages, **kwargs)
+
+    def get_model_capabilities(self) -> Dict[str, Any]:
+        return {
+            "supports_streaming": True,
+            "supports_async": True,
+            "supports_tool_calling": False,
+        }
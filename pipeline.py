@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of a pipeline.
+
+    `func` is an async callable whose keyword arguments are the names in
+    `depends_on`. A dependency is either another stage's name or a plain
+    input supplied to Pipeline.arun().
+    """
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+class Pipeline:
+    """
+    A small dependency-graph executor for multi-agent pipelines.
+
+    Stages are declared with their dependencies instead of as a hand-written
+    sequence. Every stage starts as soon as all of its dependencies have
+    finished, so independent stages (e.g. validation and safety, which both
+    only need the expanded plan) run concurrently.
+    """
+
+    def __init__(self, stages: Iterable[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate pipeline stage '{stage.name}'.")
+            self.stages[stage.name] = stage
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                cycle = " -> ".join(path + (name,))
+                raise ValueError(f"Pipeline has a dependency cycle: {cycle}")
+            state[name] = "visiting"
+            for dep in self.stages[name].depends_on:
+                if dep in self.stages:
+                    visit(dep, path + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, ())
+        return order
+
+    def _required_stages(self, targets: Iterable[str], results: Dict[str, Any]) -> set:
+        """Targets plus their transitive stage dependencies not already computed."""
+        required = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown pipeline stage '{name}'.")
+            if name in results or name in required:
+                continue
+            required.add(name)
+            pending.extend(d for d in self.stages[name].depends_on if d in self.stages)
+        return required
+
+    async def arun(
+        self,
+        inputs: Dict[str, Any],
+        targets: Optional[Iterable[str]] = None,
+        trace: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Runs the stages needed to produce `targets` (default: every stage).
+
+        Stages whose name already appears in `inputs` are treated as done and
+        not re-run, so a caller can drive the graph a few stages at a time.
+
+        If `trace` is given (see tracing.PipelineTrace), each stage runs
+        inside trace.stage(name) so its timings are recorded.
+
+        Returns:
+            A new dict holding `inputs` plus the result of every stage that ran.
+        """
+        results = dict(inputs)
+        required = self._required_stages(
+            self.stages if targets is None else targets, results
+        )
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage):
+            upstream = [tasks[d] for d in stage.depends_on if d in tasks]
+            if upstream:
+                await asyncio.gather(*upstream)
+            missing = [d for d in stage.depends_on if d not in results]
+            if missing:
+                raise KeyError(
+                    f"Stage '{stage.name}' is missing inputs: {', '.join(missing)}"
+                )
+            kwargs = {d: results[d] for d in stage.depends_on}
+            if trace is None:
+                results[stage.name] = await stage.func(**kwargs)
+            else:
+                with trace.stage(stage.name):
+                    results[stage.name] = await stage.func(**kwargs)
+
+        # Created in topological order, so every upstream task already exists.
+        for name in self.order:
+            if name in required:
+                tasks[name] = asyncio.create_task(run_stage(self.stages[name]))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return results
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlite_cache import SQLiteLRUCache
+
+DEFAULT_CACHE_PATH = os.getenv(
+    "WORKOUT_RESULT_CACHE_PATH", str(Path(".cache") / "pipeline_results.sqlite")
+)
+DEFAULT_TTL_SECONDS = float(os.getenv("WORKOUT_RESULT_CACHE_TTL", 7 * 24 * 3600))
+DEFAULT_MAX_ENTRIES = int(os.getenv("WORKOUT_RESULT_CACHE_MAX_ENTRIES", 5000))
+DEFAULT_MAX_BYTES = int(os.getenv("WORKOUT_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+# Text fairlib returns instead of raising: OpenAIAdapter's API failures and
+# SimpleAgent giving up. Neither cache layer may replay it.
+FAILURE_PREFIXES = ("Error: ", "Agent stopped after reaching max steps")
+
+
+def is_failure_output(text: str) -> bool:
+    """True for an empty output or a failure message, which must not be cached."""
+    return not text or text.startswith(FAILURE_PREFIXES)
+
+
+def _normalize(value: Any) -> Any:
+    """Case- and whitespace-insensitive form of a request field."""
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    return value
+
+
+def result_key(**fields: Any) -> str:
+    """
+    Content-addressed key for a pipeline request.
+
+    Fields are normalized (strings lower-cased, whitespace collapsed) and
+    serialized with sorted keys, so "Avoid  overhead" and "avoid overhead"
+    map to the same entry.
+    """
+    normalized = {name: _normalize(value) for name, value in fields.items()}
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PipelineResultCache(SQLiteLRUCache):
+    """
+    Persistent cache of complete pipeline runs backed by a local SQLite file.
+
+    Maps a result_key() to the stage outputs of one run (plan, expanded,
+    validation, safety). Several Streamlit worker processes can share one
+    cache file and each other's hits.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(
+            path,
+            table="pipeline_results",
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached stage outputs for `key`, or None on a miss."""
+        return super().get(key)
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Stores a run's stage outputs, unless any stage failed."""
+        if any(is_failure_output(str(output)) for output in value.values()):
+            return
+        super().put(key, value)
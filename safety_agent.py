@@ -2,35 +2,25 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import asyncio
+from typing import Optional
 
-from fairlib import SimpleAgent, ReActPlanner, ToolRegistry, ToolExecutor, WorkingMemory
-from fairlib.modules.mal.openai_adapter import OpenAIAdapter
+from fairlib.core.interfaces.llm import AbstractChatModel
+from llm_factory import build_react_agent
 from tools.safety_tool import SafetyCheckTool
 
 
-async def build_safety_agent():
+async def build_safety_agent(llm: Optional[AbstractChatModel] = None):
     """
     Builds the Safety Agent.
 
     Role:
       - Takes the full expanded workout plan as text.
       - Uses SafetyCheckTool to look for simple red flags.
-    """
-    llm = OpenAIAdapter()
-
-    registry = ToolRegistry()
-    registry.register_tool(SafetyCheckTool())
 
-    executor = ToolExecutor(registry)
-    memory = WorkingMemory()
-    planner = ReActPlanner(llm, registry)
-
-    return SimpleAgent(
-        llm=llm,
-        planner=planner,
-        tool_executor=executor,
-        memory=memory,
-    )
+    Args:
+      llm: Chat model to use. Defaults to the process-wide shared adapter.
+    """
+    return build_react_agent([SafetyCheckTool()], llm)
 
 
 async def main():
@@ -0,0 +1,26 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agent_pool import AgentPool
+
+
+async def _build_agent():
+    return SimpleNamespace(memory=SimpleNamespace(clear=lambda: None))
+
+
+def test_waiting_for_a_busy_role_times_out_and_releases_the_rest():
+    async def scenario():
+        pool = AgentPool({"safety": _build_agent, "validator": _build_agent}, size=1, timeout=0.05)
+        held = await pool.acquire("validator")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire_many(["safety", "validator"])
+        assert pool.stats()["safety"]["idle"] == 1  # released after the timeout
+
+        await pool.release("validator", held)
+        agents = await pool.acquire_many(["safety", "validator"])
+        assert agents["validator"] is held
+
+    asyncio.run(scenario())
@@ -0,0 +1,23 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.async_tool import AsyncTool
+from tools.recovery_balance_tool import RecoveryBalanceTool
+
+PLAN = """Workout Plan (3 days) — Goal: strength
+
+Day 1: Upper — 5×5 compounds, long rest
+Day 2: Lower — 5×5 compounds, long rest
+Day 3: Upper — 5×5 compounds, long rest
+"""
+
+
+def test_process_pool_keeps_the_tool_configuration():
+    tool = RecoveryBalanceTool(recovery_hours={"chest": 96})
+    assert tool.use(PLAN) != RecoveryBalanceTool().use(PLAN)
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        output = asyncio.run(AsyncTool(tool, executor=pool).ause(PLAN))
+
+    assert output == tool.use(PLAN)
@@ -0,0 +1,27 @@
+from tools.batch import BatchToolMixin
+from tools.tool_input import InputSchema, decode_tool_input
+
+
+class EchoTool(BatchToolMixin):
+    input_schema = InputSchema({"word": (str,), "times": (int, 1)})
+
+    def __init__(self):
+        self.calls = 0
+
+    def use(self, tool_input):
+        self.calls += 1
+        data = decode_tool_input(tool_input, self.input_schema)
+        return data["word"] * data["times"]
+
+
+def test_default_batch_runs_use_once_per_distinct_input():
+    tool = EchoTool()
+
+    outputs = tool.use_batch([
+        "{'word': 'a', 'times': 2}",
+        {"word": "b"},
+        '{"word": "a", "times": 2}',
+    ])
+
+    assert outputs == ["aa", "b", "aa"]
+    assert tool.calls == 2
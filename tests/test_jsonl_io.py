@@ -0,0 +1,34 @@
+from jsonl_io import read_requests
+
+
+def test_malformed_lines_are_reported_and_skipped(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text(
+        '{"id": "a", "days": 3, "goal": "strength"}\n'
+        "{not json\n"
+        '{"id": "b", "days": 4, "goal": "hypertrophy"}\n',
+        encoding="utf-8",
+    )
+
+    requests = list(read_requests(str(path)))
+
+    assert [request["id"] for request in requests] == ["a", "2", "b"]
+    assert requests[1]["error"].startswith("JSONDecodeError")
+    assert "error" not in requests[0] and "error" not in requests[2]
+
+
+def test_unusable_records_are_reported_and_skipped(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text(
+        '{"id": "a", "days": "three"}\n'
+        "[1, 2]\n"
+        '{"id": "b", "days": 4, "goal": "hypertrophy"}\n',
+        encoding="utf-8",
+    )
+
+    requests = list(read_requests(str(path)))
+
+    assert [request["id"] for request in requests] == ["a", "2", "b"]
+    assert requests[0]["error"].startswith("ValueError")
+    assert "JSON object" in requests[1]["error"]
+    assert requests[2]["days"] == 4 and "error" not in requests[2]
@@ -0,0 +1,54 @@
+from tools.periodization import REP_RANGES, iter_weeks, validate_weeks, week_load
+from tools.recovery_balance_tool import RecoveryBalanceTool
+from tools.workout_plan import Exercise, WorkoutDay, WorkoutPlan
+
+
+def _plan(*labels):
+    days = [
+        WorkoutDay(
+            number=i,
+            label=label,
+            scheme="3–4 sets × 8–12 reps",
+            exercises=[Exercise(f"{label} lift", 3, "8–12 reps", ())],
+        )
+        for i, label in enumerate(labels, start=1)
+    ]
+    return WorkoutPlan(goal="hypertrophy", days=days, days_per_week=len(days), expanded=True)
+
+
+def test_previous_week_findings_are_not_reported_again():
+    plan = _plan("Push", "Chest/Triceps", "Legs")
+    tool = RecoveryBalanceTool()
+
+    reports = [
+        report["recovery_balance_validator"]
+        for _, report in validate_weeks(iter_weeks(plan, 2, deload_every=0), [tool])
+    ]
+
+    assert "chest" in reports[0]
+    assert reports[1].count("trains chest") == 1
+    assert "repeats" not in reports[1]
+
+
+def test_reports_are_cached_per_tool_configuration():
+    plan = _plan("Push", "Legs", "Pull", "Upper")
+    default, strict = RecoveryBalanceTool(), RecoveryBalanceTool(recovery_hours={"chest": 100})
+
+    for tool in (default, strict):
+        expected = tool.analyze(plan)
+        (_, reports), = validate_weeks(iter_weeks(plan, 1), [tool])
+        assert reports["recovery_balance_validator"] == expected
+
+    assert "trains chest" in strict.analyze(plan)
+    assert "trains chest" not in default.analyze(plan)
+
+
+def test_progression_continues_without_deloads():
+    first, fifth = week_load(1, "linear", deload_every=0), week_load(5, "linear", deload_every=0)
+
+    assert not fifth.deload
+    assert fifth.day_loads[0][0] > first.day_loads[0][0]
+
+    weeks = list(iter_weeks(_plan("Upper", "Lower"), 5, deload_every=0))
+    reps = [REP_RANGES.index(week.plan.days[0].exercises[0].reps) for week in weeks]
+    assert reps[4] > reps[0]
@@ -0,0 +1,21 @@
+from result_cache import PipelineResultCache, is_failure_output
+
+OUTPUTS = {"plan": "Workout Plan", "expanded": "Expanded", "validation": "OK", "safety": "OK"}
+
+
+def test_failed_runs_are_not_cached(tmp_path):
+    cache = PipelineResultCache(str(tmp_path / "results.sqlite"))
+
+    cache.put("stopped", {**OUTPUTS, "validation": "Agent stopped after reaching max steps."})
+    cache.put("api-error", {**OUTPUTS, "safety": "Error: rate limit exceeded"})
+    cache.put("ok", OUTPUTS)
+
+    assert cache.get("stopped") is None
+    assert cache.get("api-error") is None
+    assert cache.get("ok") == OUTPUTS
+
+
+def test_failure_predicate():
+    assert is_failure_output("")
+    assert is_failure_output("Error: timeout")
+    assert not is_failure_output("No obvious safety red flags were detected.")
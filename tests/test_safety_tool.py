@@ -0,0 +1,18 @@
+from tools.plan_parser import parse_plan
+from tools.safety_tool import SafetyCheckTool
+
+DASH_BULLETS = """Expanded Workout Plan:
+
+Day 1: Push — 4×8-12
+- Bench Press — 10 sets × 5
+- Incline Press — 10 sets × 5
+- Dips — 10 sets × 5
+"""
+
+
+def test_dash_bullets_count_toward_day_volume():
+    assert parse_plan(DASH_BULLETS).days[0].total_sets == 30
+
+    report = SafetyCheckTool().use(DASH_BULLETS)
+
+    assert "around 30 total sets" in report
@@ -0,0 +1,24 @@
+import pytest
+
+from tools.muscles import label_mask, names_of
+from tools.split_optimizer import optimize_split
+
+
+def _days_training(split, muscle):
+    return sum(muscle in names_of(label_mask(label)) for label in split)
+
+
+def test_five_day_split_does_not_pile_on_shoulders():
+    assert _days_training(optimize_split(5), "shoulders") <= 2
+
+
+def test_seven_day_split_repeats_no_accessory_day():
+    split = optimize_split(7)
+
+    assert split.count("Arms") <= 1
+    assert split.count("Shoulders") <= 1
+
+
+@pytest.mark.parametrize("days", range(1, 8))
+def test_split_has_one_label_per_day(days):
+    assert len(optimize_split(days)) == days
@@ -0,0 +1,16 @@
+import pytest
+
+from tools.tool_input import ToolInputError
+from tools.workout_planner_tool import WorkoutPlannerTool
+
+
+@pytest.mark.parametrize("days", [0, 8, 10])
+def test_days_outside_a_week_are_rejected(days):
+    with pytest.raises(ToolInputError):
+        WorkoutPlannerTool().build(days, "hypertrophy")
+
+
+def test_plan_has_the_requested_days():
+    plan = WorkoutPlannerTool().build(4, "strength")
+
+    assert len(plan.days) == plan.days_per_week == 4
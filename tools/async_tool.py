@@ -0,0 +1,94 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from fairlib.core.interfaces.tools import AbstractTool
+
+# "thread" (default), "process", or "inline" to run tools on the event loop.
+TOOL_EXECUTOR = os.getenv("WORKOUT_TOOL_EXECUTOR", "thread")
+TOOL_WORKERS = int(os.getenv("WORKOUT_TOOL_WORKERS", 4))
+
+
+def build_tool_executor(kind: str = TOOL_EXECUTOR, workers: int = TOOL_WORKERS) -> Optional[Executor]:
+    """
+    Builds the pool tool calls are offloaded to; None for "inline".
+
+    A thread pool keeps the event loop free while a tool runs (the
+    interpreter switches threads every few milliseconds, so LLM I/O on the
+    loop keeps flowing). A process pool also runs tools in parallel across
+    cores, at the cost of pickling each input and output. Workers are
+    spawned, not forked: the parent holds HTTP clients and event-loop
+    threads that must not be copied.
+    """
+    if kind == "inline":
+        return None
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool")
+    if kind == "process":
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    raise ValueError(
+        f"Unknown WORKOUT_TOOL_EXECUTOR {kind!r}; use 'thread', 'process' or 'inline'."
+    )
+
+
+_tool_executor: Optional[Executor] = None
+_tool_executor_lock = threading.Lock()
+_tool_executor_built = False
+
+
+def get_tool_executor() -> Optional[Executor]:
+    """The process-wide tool pool, created on first use."""
+    global _tool_executor, _tool_executor_built
+    if not _tool_executor_built:
+        with _tool_executor_lock:
+            if not _tool_executor_built:
+                _tool_executor = build_tool_executor()
+                _tool_executor_built = True
+    return _tool_executor
+
+
+def _call_tool(tool: AbstractTool, tool_input) -> str:
+    # Module-level so a process pool can pickle it. The tool instance is
+    # pickled with it, configuration included (e.g. RecoveryBalanceTool's
+    # windows), so tools must keep their settings in picklable attributes.
+    return tool.use(tool_input)
+
+
+class AsyncTool(AbstractTool):
+    """
+    Wraps a synchronous tool with an async ause() that runs use() on an
+    executor, so a long tool call never blocks the event loop.
+
+    Role:
+      - fairlib's ToolExecutor.aexecute awaits ause() when a tool has one,
+        so agents built with wrapped tools offload every call.
+      - name, description and input_schema are the wrapped tool's; use()
+        still runs inline for synchronous callers.
+
+    Args:
+      tool: The tool to wrap.
+      executor: Pool to run on. Defaults to the shared pool configured by
+        WORKOUT_TOOL_EXECUTOR / WORKOUT_TOOL_WORKERS.
+    """
+
+    def __init__(self, tool: AbstractTool, executor: Optional[Executor] = None):
+        self.tool = tool
+        self.executor = executor
+        self.name = tool.name
+        self.description = tool.description
+        self.input_schema = getattr(tool, "input_schema", None)
+
+    def use(self, tool_input: str) -> str:
+        return self.tool.use(tool_input)
+
+    async def ause(self, tool_input: str) -> str:
+        executor = self.executor or get_tool_executor()
+        if executor is None:
+            return self.tool.use(tool_input)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _call_tool, self.tool, tool_input)
@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+from tools.tool_input import ToolInputError, decode_tool_input
+
+ToolInput = Union[str, Mapping[str, Any]]
+
+
+class BatchToolMixin:
+    """
+    Adds use_batch() to a tool that has an input_schema.
+
+    Role:
+      - Decodes every input once and runs each distinct input only once
+        (batches of generated plans repeat a lot).
+      - Hands the distinct decoded inputs to the tool's batch_outputs(), which
+        processes them together and shares its lookups across the batch
+        (the default just calls use() on each).
+      - Returns one output per input, in order, identical to what use() returns.
+    """
+
+    def use_batch(
+        self, tool_inputs: Sequence[ToolInput], return_exceptions: bool = False
+    ) -> List[Union[str, ToolInputError]]:
+        """
+        use() for many inputs at once.
+
+        With return_exceptions=True an undecodable input yields its
+        ToolInputError in place of an output instead of failing the batch.
+        """
+        outputs: List[Any] = [None] * len(tool_inputs)
+        groups: Dict[tuple, List[int]] = {}
+        unique = []
+
+        for i, tool_input in enumerate(tool_inputs):
+            try:
+                data = decode_tool_input(tool_input, self.input_schema)
+            except ToolInputError as e:
+                if not return_exceptions:
+                    raise
+                outputs[i] = e
+                continue
+            key = tuple(data.values())  # schema order; values are str / int
+            if key not in groups:
+                groups[key] = []
+                unique.append(data)
+            groups[key].append(i)
+
+        for indices, output in zip(groups.values(), self.batch_outputs(unique)):
+            for i in indices:
+                outputs[i] = output
+        return outputs
+
+    def batch_outputs(self, inputs: List[Dict[str, Any]]) -> List[str]:
+        """
+        One output per decoded input. By default each input goes through
+        use() (a decoded dict re-validates cheaply); tools override this to
+        vectorize.
+        """
+        return [self.use(data) for data in inputs]
@@ -0,0 +1,63 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+DAY_CACHE_SIZE = int(os.getenv("WORKOUT_DAY_CACHE_SIZE", 4096))
+
+_MISSING = object()
+
+
+class DayCache:
+    """
+    Bounded LRU map from a day fingerprint to a piece of a tool's result.
+
+    Role:
+      - Tools compute their output one day at a time, look each piece up
+        here first, and stitch the report together from cached and new
+        pieces. Editing one day of a plan recomputes only that day; the
+        repeated weeks of a multi-week plan are computed once.
+      - Keys are WorkoutDay.fingerprint strings (exact content, so no false
+        hits) or other small hashable keys. Cached pieces are shared; treat
+        them as read-only.
+      - Safe to use from the tool thread pool.
+    """
+
+    def __init__(self, max_entries: int = DAY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
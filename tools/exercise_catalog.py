@@ -0,0 +1,399 @@
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from tools.muscles import MUSCLES, label_key, label_mask, names_of
+
+DEFAULT_CATALOG_PATH = os.getenv(
+    "WORKOUT_EXERCISE_CATALOG_PATH", str(Path(".cache") / "exercise_catalog.sqlite")
+)
+
+# Bump whenever the seed below changes; older catalog files are rebuilt.
+SEED_VERSION = "1"
+
+# Label lookups visit muscles in MUSCLES (bit) order.
+MUSCLE_GROUPS = {"arms": ("biceps", "triceps")}
+MUSCLE_ALIASES = {
+    "abs": "core", "quads": "legs", "quad": "legs", "delts": "shoulders",
+    "lats": "back", "pecs": "chest", "calf": "calves", "arms": "arms",
+}
+
+
+# ============================
+# Seed Data
+# ============================
+PRESS = ("Incline", "Decline", "Close-Grip", "Wide-Grip", "Paused", "Tempo", "Single-Arm", "Floor")
+PULL = ("Wide-Grip", "Close-Grip", "Neutral-Grip", "Underhand", "Single-Arm", "Paused", "Tempo", "Chest-Supported")
+SQUAT = ("Paused", "Tempo", "Box", "Heels-Elevated", "Pin", "1.5-Rep", "Wide-Stance", "Narrow-Stance")
+HINGE = ("Paused", "Deficit", "Block", "Tempo", "Single-Leg", "Snatch-Grip", "Stiff-Leg", "Banded")
+LUNGE = ("Reverse", "Walking", "Lateral", "Curtsy", "Deficit", "Front-Foot-Elevated", "Paused", "Tempo")
+ISOLATION = ("Single-Arm", "Seated", "Standing", "Incline", "Kneeling", "Tempo", "Partial", "Lean-Away")
+CORE = ("Weighted", "Tempo", "Kneeling", "Standing", "Single-Side", "Paused", "Long-Lever", "Banded")
+DIP = ("Weighted", "Assisted", "Bench", "Ring", "Paused", "Tempo", "Banded", "Straight-Bar")
+BRIDGE = ("Single-Leg", "Paused", "Tempo", "Feet-Elevated", "Banded", "Frog", "Marching", "Long-Lever")
+CALF = ("Seated", "Standing", "Single-Leg", "Donkey", "Paused", "Tempo", "Bent-Knee", "Deficit")
+
+# (name, variant stem, movement pattern, primary, secondaries, equipment, modifiers)
+# The first entry per primary muscle is what label lookups pick first; the
+# first equipment is the one the plain name implies.
+BASE_EXERCISES = [
+    ("Bench Press", "Bench Press", "horizontal push", "chest", ("triceps", "shoulders"), ("barbell", "dumbbell", "smith machine", "machine"), PRESS),
+    ("Incline DB Press", "Incline Press", "horizontal push", "chest", ("shoulders", "triceps"), ("dumbbell", "barbell", "smith machine", "machine"), PRESS),
+    ("Pushups", "Push-Up", "horizontal push", "chest", ("triceps", "shoulders", "core"), ("bodyweight", "band", "suspension trainer"), PRESS),
+    ("Chest Flyes", "Fly", "isolation", "chest", ("shoulders",), ("dumbbell", "cable", "machine", "band"), ISOLATION),
+    ("Dips", "Dip", "vertical push", "chest", ("triceps", "shoulders"), ("bodyweight", "machine"), DIP),
+    ("Pull-Ups", "Pull-Up", "vertical pull", "back", ("biceps",), ("bodyweight", "band", "machine"), PULL),
+    ("Barbell Rows", "Row", "horizontal pull", "back", ("biceps", "shoulders"), ("barbell", "dumbbell", "kettlebell", "landmine"), PULL),
+    ("Rows", "Seated Row", "horizontal pull", "back", ("biceps",), ("cable", "machine", "band"), PULL),
+    ("Lat Pulldowns", "Pulldown", "vertical pull", "back", ("biceps",), ("cable", "machine", "band"), PULL),
+    ("Chin-Ups", "Chin-Up", "vertical pull", "back", ("biceps",), ("bodyweight", "band", "machine"), PULL),
+    ("Inverted Rows", "Inverted Row", "horizontal pull", "back", ("biceps", "core"), ("bodyweight", "suspension trainer", "smith machine"), PULL),
+    ("Straight-Arm Pulldowns", "Straight-Arm Pulldown", "isolation", "back", (), ("cable", "band"), ISOLATION),
+    ("Shrugs", "Shrug", "isolation", "back", (), ("barbell", "dumbbell", "trap bar", "machine"), ISOLATION),
+    ("Overhead Press", "Overhead Press", "vertical push", "shoulders", ("triceps",), ("barbell", "dumbbell", "kettlebell", "smith machine", "machine", "landmine"), PRESS),
+    ("Lateral Raises", "Lateral Raise", "isolation", "shoulders", (), ("dumbbell", "cable", "machine", "band"), ISOLATION),
+    ("Face Pulls", "Face Pull", "horizontal pull", "shoulders", ("back",), ("cable", "band"), ISOLATION),
+    ("Rear Delt Flyes", "Rear Delt Fly", "isolation", "shoulders", ("back",), ("dumbbell", "cable", "machine", "band"), ISOLATION),
+    ("Arnold Press", "Arnold Press", "vertical push", "shoulders", ("triceps",), ("dumbbell", "kettlebell"), PRESS),
+    ("Front Raises", "Front Raise", "isolation", "shoulders", (), ("dumbbell", "cable", "barbell", "band"), ISOLATION),
+    ("Upright Rows", "Upright Row", "vertical pull", "shoulders", ("back",), ("barbell", "ez bar", "cable", "dumbbell"), PULL),
+    ("Biceps Curls", "Curl", "isolation", "biceps", (), ("dumbbell", "barbell", "ez bar", "cable", "band"), ISOLATION),
+    ("Hammer Curls", "Hammer Curl", "isolation", "biceps", (), ("dumbbell", "cable", "band"), ISOLATION),
+    ("Preacher Curls", "Preacher Curl", "isolation", "biceps", (), ("ez bar", "dumbbell", "machine"), ISOLATION),
+    ("Triceps Extensions", "Triceps Extension", "isolation", "triceps", (), ("dumbbell", "cable", "ez bar", "band"), ISOLATION),
+    ("Triceps Dips", "Triceps Dip", "vertical push", "triceps", ("chest", "shoulders"), ("bodyweight", "machine"), DIP),
+    ("Skull Crushers", "Skull Crusher", "isolation", "triceps", (), ("ez bar", "barbell", "dumbbell"), ISOLATION),
+    ("Triceps Pushdowns", "Pushdown", "isolation", "triceps", (), ("cable", "band"), ISOLATION),
+    ("Squats", "Squat", "squat", "legs", ("glutes", "core"), ("barbell", "dumbbell", "kettlebell", "smith machine"), SQUAT),
+    ("Leg Press", "Leg Press", "squat", "legs", ("glutes",), ("machine",), SQUAT),
+    ("Front Squats", "Front Squat", "squat", "legs", ("glutes", "core"), ("barbell", "kettlebell", "dumbbell"), SQUAT),
+    ("Lunges", "Lunge", "lunge", "legs", ("glutes",), ("dumbbell", "barbell", "kettlebell", "bodyweight", "smith machine"), LUNGE),
+    ("Walking Lunges", "Walking Lunge", "lunge", "legs", ("glutes", "core"), ("bodyweight", "dumbbell", "kettlebell"), LUNGE),
+    ("Bulgarian Split Squats", "Bulgarian Split Squat", "lunge", "legs", ("glutes",), ("dumbbell", "barbell", "kettlebell", "bodyweight", "smith machine"), LUNGE),
+    ("Step-Ups", "Step-Up", "lunge", "legs", ("glutes",), ("dumbbell", "bodyweight", "kettlebell", "barbell"), LUNGE),
+    ("Hack Squats", "Hack Squat", "squat", "legs", ("glutes",), ("machine", "barbell"), SQUAT),
+    ("Goblet Squats", "Goblet Squat", "squat", "legs", ("glutes", "core"), ("dumbbell", "kettlebell"), SQUAT),
+    ("Leg Extensions", "Leg Extension", "isolation", "legs", (), ("machine", "band"), ISOLATION),
+    ("Hip Thrusts", "Hip Thrust", "hinge", "glutes", ("hamstrings",), ("barbell", "machine", "dumbbell", "band", "smith machine"), BRIDGE),
+    ("Glute Bridges", "Glute Bridge", "hinge", "glutes", ("hamstrings",), ("bodyweight", "barbell", "dumbbell", "band", "machine"), BRIDGE),
+    ("Kettlebell Swings", "Swing", "hinge", "glutes", ("hamstrings", "core"), ("kettlebell", "dumbbell"), HINGE),
+    ("Cable Kickbacks", "Kickback", "isolation", "glutes", (), ("cable", "band", "machine"), ISOLATION),
+    ("Deadlifts", "Deadlift", "hinge", "hamstrings", ("glutes", "back", "core"), ("barbell", "trap bar", "dumbbell", "kettlebell"), HINGE),
+    ("Romanian Deadlift", "Romanian Deadlift", "hinge", "hamstrings", ("glutes", "back"), ("barbell", "dumbbell", "kettlebell", "smith machine", "landmine"), HINGE),
+    ("Hamstring Curls", "Leg Curl", "isolation", "hamstrings", (), ("machine", "cable", "band", "dumbbell"), ISOLATION),
+    ("Good Mornings", "Good Morning", "hinge", "hamstrings", ("glutes", "back"), ("barbell", "band", "smith machine"), HINGE),
+    ("Nordic Curls", "Nordic Curl", "isolation", "hamstrings", ("glutes",), ("bodyweight", "band"), HINGE),
+    ("Calf Raises", "Calf Raise", "isolation", "calves", (), ("machine", "dumbbell", "smith machine", "bodyweight", "barbell"), CALF),
+    ("Planks", "Plank", "core", "core", (), ("bodyweight", "band"), CORE),
+    ("Hanging Leg Raises", "Hanging Leg Raise", "core", "core", (), ("bodyweight",), CORE),
+    ("Cable Crunches", "Crunch", "core", "core", (), ("cable", "machine", "bodyweight", "band"), CORE),
+    ("Pallof Press", "Pallof Press", "core", "core", (), ("cable", "band"), CORE),
+    ("Ab Wheel Rollouts", "Rollout", "core", "core", (), ("bodyweight", "barbell"), CORE),
+    ("Russian Twists", "Russian Twist", "core", "core", (), ("bodyweight", "dumbbell", "kettlebell"), CORE),
+    ("Farmer's Carries", "Carry", "carry", "core", ("back",), ("dumbbell", "kettlebell", "trap bar"), CORE),
+]
+
+# Curated exercises per split label, in order; these are the defaults the
+# exercise generator has always used.
+LABEL_EXERCISES = {
+    "push": ["Bench Press", "Overhead Press", "Triceps Dips", "Pushups"],
+    "pull": ["Pull-Ups", "Barbell Rows", "Lat Pulldowns", "Biceps Curls"],
+    "legs": ["Squats", "Deadlifts", "Leg Press", "Lunges"],
+    "upper": ["Bench Press", "Rows", "Overhead Press", "Pull-Ups"],
+    "lower": ["Squats", "Glute Bridges", "Hamstring Curls", "Calf Raises"],
+    "chest/triceps": ["Bench Press", "Incline DB Press", "Triceps Extensions"],
+    "back/biceps": ["Pull-Ups", "Barbell Rows", "Face Pulls", "Hammer Curls"],
+    "shoulders": ["Overhead Press", "Lateral Raises", "Rear Delt Flyes"],
+    "arms": ["Biceps Curls", "Skull Crushers", "Hammer Curls"],
+    "glutes/hamstrings": ["Romanian Deadlift", "Glute Bridges", "Hamstring Curls"],
+}
+FALLBACK_EXERCISES = ["Walking Lunges", "Pushups"]
+
+
+def seed_rows():
+    """
+    Expands BASE_EXERCISES into catalog rows:
+    (name, base, pattern, equipment, primary, muscles, rank).
+
+    Every base yields its plain name plus one variant per equipment ×
+    (none + each modifier + "Paused" on each modifier), e.g.
+    "Incline Dumbbell Bench Press" or "Paused Deficit Trap Bar Deadlift".
+    """
+    seen = set()
+    for name, stem, pattern, primary, secondary, equipment, modifiers in BASE_EXERCISES:
+        muscles = ",".join((primary,) + secondary)
+        yield name, name, pattern, equipment[0], primary, muscles, 0
+        seen.add(name)
+
+        rank = 1
+        for gear in equipment:
+            gear_word = "" if gear == "bodyweight" else gear.title() + " "
+            prefixes = [""] + [f"{m} " for m in modifiers]
+            prefixes += [f"Paused {m} " for m in modifiers if m not in ("Paused", "Tempo")]
+            for prefix in prefixes:
+                variant = f"{prefix}{gear_word}{stem}"
+                if variant in seen:
+                    continue
+                seen.add(variant)
+                yield variant, name, pattern, gear, primary, muscles, rank
+                rank += 1
+
+
+# ============================
+# Catalog
+# ============================
+class CatalogExercise(NamedTuple):
+    name: str
+    base: str
+    pattern: str
+    equipment: str
+    muscles: Tuple[str, ...]  # primary first
+
+
+_COLUMNS = "name, base, pattern, equipment, muscles"
+
+
+def _row_to_exercise(row) -> CatalogExercise:
+    name, base, pattern, equipment, muscles = row
+    return CatalogExercise(name, base, pattern, equipment, tuple(muscles.split(",")))
+
+
+def build_catalog(path: str):
+    """
+    Writes the seed catalog to `path` with its indexes.
+
+    The file is built under a temporary name and moved into place, so
+    processes opening the catalog concurrently never see a half-built one.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(
+            """
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE exercises (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                base TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                equipment TEXT NOT NULL,
+                primary_muscle TEXT NOT NULL,
+                muscles TEXT NOT NULL,
+                rank INTEGER NOT NULL
+            );
+            CREATE TABLE exercise_muscles (
+                muscle TEXT NOT NULL,
+                role TEXT NOT NULL,
+                exercise_id INTEGER NOT NULL REFERENCES exercises(id)
+            );
+            CREATE TABLE label_exercises (
+                label TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                exercise_id INTEGER NOT NULL REFERENCES exercises(id),
+                PRIMARY KEY (label, position)
+            );
+            """
+        )
+        with conn:
+            for row in seed_rows():
+                name, _, _, _, primary, muscles, _ = row
+                cursor = conn.execute(
+                    "INSERT INTO exercises (name, base, pattern, equipment, primary_muscle, muscles, rank) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+                conn.executemany(
+                    "INSERT INTO exercise_muscles (muscle, role, exercise_id) VALUES (?, ?, ?)",
+                    [
+                        (muscle, "primary" if muscle == primary else "secondary", cursor.lastrowid)
+                        for muscle in muscles.split(",")
+                    ],
+                )
+            for label, names in LABEL_EXERCISES.items():
+                for position, name in enumerate(names):
+                    conn.execute(
+                        "INSERT INTO label_exercises (label, position, exercise_id) "
+                        "SELECT ?, ?, id FROM exercises WHERE name = ?",
+                        (label, position, name),
+                    )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [("source", "seed"), ("seed_version", SEED_VERSION)],
+            )
+        conn.executescript(
+            """
+            CREATE INDEX idx_exercises_pattern ON exercises (pattern, rank, id);
+            CREATE INDEX idx_exercises_equipment ON exercises (equipment, rank, id);
+            CREATE INDEX idx_exercises_primary ON exercises (primary_muscle, rank, id);
+            CREATE INDEX idx_exercise_muscles ON exercise_muscles (muscle, role, exercise_id);
+            ANALYZE;
+            """
+        )
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+class ExerciseCatalog:
+    """
+    Indexed exercise catalog backed by a local SQLite file.
+
+    Role:
+      - Stores every exercise with its movement pattern, equipment and
+        primary/secondary muscles, indexed on each, plus the curated
+        exercise lists per split label.
+      - Answers label lookups for ExerciseGeneratorTool: the curated list if
+        the label has one, otherwise the top exercise for each muscle the
+        label trains ("Upper Body", "Full Body", "Chest & Back", ...).
+      - Memoizes lookups, so repeated labels cost a dict hit; cold lookups
+        are single indexed queries.
+
+    The file is created from the built-in seed on first use. Any SQLite file
+    with the same schema (e.g. a bigger licensed catalog) can replace it;
+    give it a meta row ('source', 'custom') so it is never rebuilt.
+    """
+
+    def __init__(self, path: str = DEFAULT_CATALOG_PATH):
+        self.path = path
+        if not self._is_current(path):
+            build_catalog(path)
+        self._conn = sqlite3.connect(
+            Path(path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._memo: Dict[tuple, Tuple[CatalogExercise, ...]] = {}
+
+    @staticmethod
+    def _is_current(path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        try:
+            conn = sqlite3.connect(path)
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError:
+            return False
+        # Only catalogs built from the seed are rebuilt when the seed changes.
+        return meta.get("source", "seed") != "seed" or meta.get("seed_version") == SEED_VERSION
+
+    def _fetch(self, sql: str, params: tuple) -> Tuple[CatalogExercise, ...]:
+        key = (sql, params)
+        cached = self._memo.get(key)
+        if cached is None:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+            cached = self._memo[key] = tuple(_row_to_exercise(r) for r in rows)
+        return cached
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM exercises").fetchone()[0]
+
+    def get(self, name: str) -> Optional[CatalogExercise]:
+        found = self._fetch(f"SELECT {_COLUMNS} FROM exercises WHERE name = ?", (name,))
+        return found[0] if found else None
+
+    def query(
+        self,
+        muscle: Optional[str] = None,
+        primary_only: bool = True,
+        equipment: Optional[str] = None,
+        pattern: Optional[str] = None,
+        limit: int = 20,
+    ) -> Tuple[CatalogExercise, ...]:
+        """Exercises matching every given filter, plain names first."""
+        clauses, params = [], []
+        if muscle is not None:
+            if primary_only:
+                clauses.append("primary_muscle = ?")
+            else:
+                clauses.append("id IN (SELECT exercise_id FROM exercise_muscles WHERE muscle = ?)")
+            params.append(muscle)
+        if equipment is not None:
+            clauses.append("equipment = ?")
+            params.append(equipment)
+        if pattern is not None:
+            clauses.append("pattern = ?")
+            params.append(pattern)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {_COLUMNS} FROM exercises {where} ORDER BY rank, id LIMIT ?"
+        return self._fetch(sql, tuple(params) + (limit,))
+
+    def for_label(self, label: Optional[str], limit: int = 4) -> Tuple[CatalogExercise, ...]:
+        """Exercises for a split label, as ExerciseGeneratorTool uses them."""
+        key = label_key(label or "")
+        curated = self._fetch(
+            f"SELECT {_COLUMNS} FROM label_exercises l JOIN exercises e ON e.id = l.exercise_id "
+            "WHERE l.label = ? ORDER BY l.position",
+            (key,),
+        )
+        if curated:
+            return curated
+
+        memo_key = ("label", key, limit)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        # One exercise per trained muscle, round-robin until `limit`.
+        muscles = label_muscles(key)
+        candidates = [list(self.query(muscle=m, limit=limit)) for m in muscles]
+        picked: List[CatalogExercise] = []
+        while len(picked) < limit and any(candidates):
+            for options in candidates:
+                while options and options[0] in picked:
+                    options.pop(0)
+                if options and len(picked) < limit:
+                    picked.append(options.pop(0))
+
+        if not picked:
+            picked = [self.get(name) for name in FALLBACK_EXERCISES]
+        self._memo[memo_key] = result = tuple(picked)
+        return result
+
+    def close(self):
+        self._conn.close()
+
+
+def label_muscles(label: str) -> Tuple[str, ...]:
+    """
+    Muscles a split label trains, in MUSCLES order: the split-label table
+    plus any muscle named in the label ("Chest & Back", "Full Body", ...).
+    """
+    key = label_key(label)
+    named = set(names_of(label_mask(key)))
+    words = re.findall(r"[a-z]+", key)
+    if "full" in words or "total" in words:
+        named.update(MUSCLES)
+    for word in words:
+        word = MUSCLE_ALIASES.get(word, word)
+        if word.rstrip("s") + "s" in MUSCLES:
+            word = word.rstrip("s") + "s"
+        named.add(word)
+
+    for group, members in MUSCLE_GROUPS.items():
+        if group in named:
+            named.update(members)
+    return tuple(m for m in MUSCLES if m in named)
+
+
+_catalog: Optional[ExerciseCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> ExerciseCatalog:
+    """The process-wide catalog, opened (and built if needed) on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = ExerciseCatalog()
+    return _catalog
@@ -1,10 +1,33 @@
+from typing import Optional, Tuple
+
 from fairlib.core.interfaces.tools import AbstractTool
 
+from tools.batch import BatchToolMixin
+from tools.day_cache import DayCache
+from tools.exercise_catalog import get_catalog
+from tools.plan_parser import parse_plan
+from tools.tool_input import InputSchema, decode_tool_input
+from tools.workout_plan import Exercise, WorkoutDay, WorkoutPlan
+
+# Set/Rep Schemes
+GOAL_SCHEMES = {
+    "strength": (5, "3–5 reps"),
+    "hypertrophy": (4, "8–12 reps"),
+    "endurance": (3, "15–20 reps"),
+}
+
+# (split label, goal) -> the exercises of an expanded day (shared, read-only).
+_DAY_EXERCISES = DayCache()
 
-class ExerciseGeneratorTool(AbstractTool):
+
+class ExerciseGeneratorTool(BatchToolMixin, AbstractTool):
     """
     Expands a split-based workout plan by adding specific exercises
     with sets and reps according to the user's goal.
+
+    Exercises come from the indexed exercise catalog (tools/exercise_catalog.py):
+    the curated list for known split labels, otherwise picked by the muscles
+    the label trains.
     """
 
     name = "exercise_generator"
@@ -13,54 +36,45 @@ class ExerciseGeneratorTool(AbstractTool):
         "exercises with sets and reps based on the user's goal. "
         "Input: {'plan': str, 'goal': 'strength'|'hypertrophy'|'endurance'}"
     )
+    input_schema = InputSchema({"plan": (str, ""), "goal": (str, "hypertrophy")})
 
     def use(self, tool_input: str) -> str:
-        data = eval(tool_input)
-        raw_plan = data.get("plan", "")
-        goal = data.get("goal", "hypertrophy")
+        data = decode_tool_input(tool_input, self.input_schema)
+        return str(self.expand(parse_plan(data["plan"]), data["goal"]))
 
-        # Set/Rep Schemes
-        goal_map = {
-            "strength": ("5 sets", "3–5 reps"),
-            "hypertrophy": ("4 sets", "8–12 reps"),
-            "endurance": ("3 sets", "15–20 reps")
-        }
-        sets, reps = goal_map.get(goal, goal_map["hypertrophy"])
+    def batch_outputs(self, inputs):
+        return [str(self.expand(parse_plan(data["plan"]), data["goal"])) for data in inputs]
 
-        # Exercise mapping by split label
-        exercise_map = {
-            "push": ["Bench Press", "Overhead Press", "Triceps Dips", "Pushups"],
-            "pull": ["Pull-Ups", "Barbell Rows", "Lat Pulldowns", "Biceps Curls"],
-            "legs": ["Squats", "Deadlifts", "Leg Press", "Lunges"],
-            "upper": ["Bench Press", "Rows", "Overhead Press", "Pull-Ups"],
-            "lower": ["Squats", "Glute Bridges", "Hamstring Curls", "Calf Raises"],
-            "chest/triceps": ["Bench Press", "Incline DB Press", "Triceps Extensions"],
-            "back/biceps": ["Pull-Ups", "Barbell Rows", "Face Pulls", "Hammer Curls"],
-            "shoulders": ["Overhead Press", "Lateral Raises", "Rear Delt Flyes"],
-            "arms": ["Biceps Curls", "Skull Crushers", "Hammer Curls"],
-            "glutes/hamstrings": ["Romanian Deadlift", "Glute Bridges", "Hamstring Curls"],
-        }
-
-        output_lines = ["Expanded Workout Plan:\n"]
-
-        # Parse each "Day X: Label" line
-        for line in raw_plan.splitlines():
-            if line.lower().startswith("day"):
-                output_lines.append(line)
-
-                # Extract split label
-                label = (
-                    line.split(":", 1)[1]
-                    .split("—")[0]
-                    .split("-")[0]
-                    .strip()
-                    .lower()
+    def expand(self, plan: WorkoutPlan, goal: str) -> WorkoutPlan:
+        """Structured form of use(): a new, expanded WorkoutPlan."""
+        # One expanded day per "Day X: Label" day; a day's exercises depend
+        # only on its label and the goal, so unchanged days come from the cache.
+        expanded_days = []
+        for day in plan.days:
+            exercises = _DAY_EXERCISES.get_or_compute(
+                (day.label, goal), lambda: self._exercises_for(day.label, goal)
+            )
+            expanded_days.append(
+                WorkoutDay(
+                    number=day.number,
+                    label=day.label,
+                    scheme=day.scheme,
+                    exercises=list(exercises),
+                    heading=day.heading,
                 )
+            )
 
-                exercises = exercise_map.get(label, ["Walking Lunges", "Pushups"])
-                for ex in exercises:
-                    output_lines.append(f"  • {ex} — {sets} × {reps}")
-
-                output_lines.append("")  # blank line
+        return WorkoutPlan(
+            goal=goal,
+            days=expanded_days,
+            days_per_week=plan.days_per_week,
+            expanded=True,
+        )
 
-        return "\n".join(output_lines)
+    @staticmethod
+    def _exercises_for(label: Optional[str], goal: str) -> Tuple[Exercise, ...]:
+        sets, reps = GOAL_SCHEMES.get(goal, GOAL_SCHEMES["hypertrophy"])
+        return tuple(
+            Exercise(name=entry.name, sets=sets, reps=reps, muscles=entry.muscles)
+            for entry in get_catalog().for_label(label)
+        )
@@ -1,12 +1,31 @@
+from typing import Optional
+
 from fairlib.core.interfaces.tools import AbstractTool
 
+from tools.batch import BatchToolMixin
+from tools.muscles import Muscle, names_of
+from tools.plan_parser import parse_plan
+from tools.tool_input import PLAN_TEXT_INPUT, decode_tool_input
+from tools.volume import VolumeMatrix, volume_matrices, volume_matrix
+from tools.workout_plan import WorkoutPlan
+
+REQUIRED_MUSCLES = int(
+    Muscle.CHEST | Muscle.BACK | Muscle.SHOULDERS | Muscle.LEGS
+    | Muscle.GLUTES | Muscle.ARMS | Muscle.CORE
+)
+CORE = int(Muscle.CORE)
+
+# Weekly weighted sets below which a trained muscle is flagged.
+LOW_WEEKLY_SETS = 6
 
-class MuscleCoverageValidatorTool(AbstractTool):
+
+class MuscleCoverageValidatorTool(BatchToolMixin, AbstractTool):
     """
     Checks which major muscle groups are covered by a workout plan.
 
     Input: the full workout plan as a plain text string.
     Output: a short report describing which muscles are covered and which are missing.
+    For expanded plans it also reports weekly set volume per muscle.
     """
 
     name = "muscle_coverage_validator"
@@ -16,63 +35,41 @@ class MuscleCoverageValidatorTool(AbstractTool):
         "based on the split labels (Upper, Lower, Push, Pull, etc.) and "
         "report any that appear under-served or missing."
     )
+    input_schema = PLAN_TEXT_INPUT
 
     def use(self, tool_input: str) -> str:
-        plan_text = tool_input.lower()
-
-        # Extract labels from lines like "Day 1: Upper — 8–12 reps..."
-        day_lines = [
-            line.strip()
-            for line in plan_text.splitlines()
-            if line.strip().startswith("day")
+        plan_text = decode_tool_input(tool_input, self.input_schema)["plan"]
+        return self.analyze(parse_plan(plan_text))
+
+    def batch_outputs(self, inputs):
+        plans = [parse_plan(data["plan"]) for data in inputs]
+        # Only expanded plans report volume; build all their matrices at once.
+        volumes = iter(volume_matrices([plan for plan in plans if plan.expanded]))
+        return [
+            self.analyze(plan, next(volumes) if plan.expanded else None)
+            for plan in plans
         ]
 
-        split_labels = []
-        for line in day_lines:
-            # crude parsing: "Day X: Label ..."
-            if ":" in line:
-                after_colon = line.split(":", 1)[1]
-                label = after_colon.split("—")[0].split("-")[0].strip()
-                split_labels.append(label.lower())
-
-        # Map split labels to muscle groups
-        label_to_muscles = {
-            "upper": {"chest", "back", "shoulders", "arms"},
-            "lower": {"legs", "glutes"},
-            "push": {"chest", "shoulders", "triceps"},
-            "pull": {"back", "biceps"},
-            "legs": {"legs", "glutes"},
-            "chest/triceps": {"chest", "triceps"},
-            "back/biceps": {"back", "biceps"},
-            "shoulders": {"shoulders"},
-            "arms": {"biceps", "triceps"},
-            "glutes/hamstrings": {"glutes", "hamstrings"},
-        }
-
-        required_muscles = {
-            "chest",
-            "back",
-            "shoulders",
-            "legs",
-            "glutes",
-            "arms",
-            "core",
-        }
-
-        covered = set()
-        for label in split_labels:
-            for key, muscles in label_to_muscles.items():
-                if key in label:
-                    covered.update(muscles)
+    def analyze(self, plan: WorkoutPlan, volume: Optional[VolumeMatrix] = None) -> str:
+        """
+        Structured form of use(): the report for a WorkoutPlan.
+        `volume` is the plan's VolumeMatrix when the caller already has it.
+        """
+        # Labels from lines like "Day 1: Upper — 8–12 reps..."
+        split_labels = plan.labels
+
+        covered = 0
+        for day in plan.days:
+            covered |= day.mask
 
         # crude rule: if we see "upper" anywhere, assume some core work too
         if any("upper" in s or "lower" in s for s in split_labels):
-            covered.add("core")
+            covered |= CORE
 
-        missing = sorted(required_muscles - covered)
-        covered_list = sorted(covered)
+        missing = names_of(REQUIRED_MUSCLES & ~covered)
+        covered_list = names_of(covered)
 
-        if not day_lines:
+        if not plan.days:
             return "Unable to detect any day splits in the workout plan text."
 
         report_lines = [
@@ -93,4 +90,17 @@ class MuscleCoverageValidatorTool(AbstractTool):
                 "- All major muscle groups appear to have at least some coverage based on the split labels."
             )
 
+        if plan.expanded:
+            weekly = (volume or volume_matrix(plan)).weekly
+            per_muscle = sorted(VolumeMatrix.by_muscle(weekly).items())
+            report_lines.append(
+                "- Weekly sets per muscle (approx): "
+                + ", ".join(f"{name} {sets:g}" for name, sets in per_muscle)
+            )
+            low = [name for name, sets in per_muscle if sets < LOW_WEEKLY_SETS]
+            if low:
+                report_lines.append(
+                    f"- Low weekly volume (under {LOW_WEEKLY_SETS} sets): {', '.join(low)}"
+                )
+
         return "\n".join(report_lines)
@@ -0,0 +1,96 @@
+from enum import IntFlag
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+
+class Muscle(IntFlag):
+    """
+    Muscle groups as bit flags, so sets of muscles are plain ints and
+    coverage, missing groups and overlap are single OR / AND operations.
+
+    ARMS is its own bit: split labels like "Upper" claim the arms as a whole,
+    separately from the biceps and triceps that "Pull" / "Push" train.
+    """
+
+    CHEST = 1 << 0
+    BACK = 1 << 1
+    SHOULDERS = 1 << 2
+    LEGS = 1 << 3
+    GLUTES = 1 << 4
+    HAMSTRINGS = 1 << 5
+    BICEPS = 1 << 6
+    TRICEPS = 1 << 7
+    CALVES = 1 << 8
+    CORE = 1 << 9
+    ARMS = 1 << 10
+
+
+# Individual muscles (everything but the ARMS group), in bit order.
+MUSCLES = tuple(m.name.lower() for m in Muscle if m is not Muscle.ARMS)
+ALL_MUSCLES = int(sum(Muscle))
+
+_BITS = {m.name.lower(): int(m) for m in Muscle}
+
+
+@lru_cache(maxsize=4096)
+def _mask_of(names: Tuple[str, ...]) -> int:
+    mask = 0
+    for name in names:
+        mask |= _BITS.get(name, 0)
+    return mask
+
+
+def mask_of(names: Iterable[str]) -> int:
+    """Bit mask for muscle names; unknown names are ignored."""
+    return _mask_of(tuple(names))
+
+
+@lru_cache(maxsize=4096)
+def names_of(mask: int) -> Tuple[str, ...]:
+    """Muscle names in a mask, alphabetically (as the reports list them)."""
+    return tuple(sorted(name for name, bit in _BITS.items() if mask & bit))
+
+
+@lru_cache(maxsize=1024)
+def mask_columns(mask: int) -> Tuple[int, ...]:
+    """Indexes into MUSCLES of the muscles in a mask (ARMS = biceps + triceps)."""
+    if mask & Muscle.ARMS:
+        mask |= Muscle.BICEPS | Muscle.TRICEPS
+    return tuple(i for i in range(len(MUSCLES)) if mask & (1 << i))
+
+
+# ============================
+# Split Labels
+# ============================
+# Muscle groups trained by each split label. A day trains the union for
+# every key contained in its label ("back/biceps" also matches "back").
+LABEL_MUSCLES = {
+    "upper": {"chest", "back", "shoulders", "arms"},
+    "lower": {"legs", "glutes"},
+    "push": {"chest", "shoulders", "triceps"},
+    "pull": {"back", "biceps"},
+    "legs": {"legs", "glutes"},
+    "chest/triceps": {"chest", "triceps"},
+    "back/biceps": {"back", "biceps"},
+    "shoulders": {"shoulders"},
+    "arms": {"biceps", "triceps"},
+    "glutes/hamstrings": {"glutes", "hamstrings"},
+    "full body": {"chest", "back", "shoulders", "legs", "glutes", "core"},
+}
+LABEL_MASKS = {label: mask_of(muscles) for label, muscles in LABEL_MUSCLES.items()}
+
+
+def label_key(label: str) -> str:
+    """Lookup form of a split label: lower-cased, cut at the first "-"."""
+    return label.split("-")[0].strip().lower()
+
+
+@lru_cache(maxsize=4096)
+def label_mask(label: str) -> int:
+    """Muscles trained by a split label, as a mask; computed once per label."""
+    key = label_key(label)
+    mask = 0
+    for name, label_bits in LABEL_MASKS.items():
+        if name in key:
+            mask |= label_bits
+    return mask
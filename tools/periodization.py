@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from tools.day_cache import DayCache
+from tools.workout_plan import Exercise, WorkoutDay, WorkoutPlan
+
+# Rep ranges from lightest to heaviest; the generator's goal schemes sit on
+# this ladder, and periodization moves days up and down it.
+REP_RANGES = ("15–20 reps", "12–15 reps", "8–12 reps", "6–8 reps", "3–5 reps")
+
+DELOAD_EVERY = 4  # every 4th week is a deload week
+BLOCK_PHASES = ("Accumulation", "Transmutation", "Realization")
+
+# (day fingerprint, intensity shift, set change, deload) -> the loaded day
+# (shared, read-only). Weeks with the same loads reuse the same day objects,
+# so the validators' per-day caches hit on them too.
+_LOADED_DAYS = DayCache()
+
+
+# ============================
+# Weekly Loads
+# ============================
+@dataclass(frozen=True)
+class WeekLoad:
+    """
+    How one week differs from the base plan.
+
+    day_loads holds (intensity shift, set change) pairs, applied to the
+    training days in turn: a shift of +1 moves a day one rep range heavier
+    on REP_RANGES. Deload weeks halve the sets at the base rep range.
+    """
+
+    phase: str
+    day_loads: Tuple[Tuple[int, int], ...] = ((0, 0),)
+    deload: bool = False
+
+
+def _linear(week: int, meso: int, position: int) -> WeekLoad:
+    # Lighter and fuller to heavier and leaner across each mesocycle.
+    return WeekLoad(f"Linear {position + 1}", ((position - 1, 1 - position),))
+
+
+def _undulating(week: int, meso: int, position: int) -> WeekLoad:
+    # Daily undulation: light/high-volume, moderate, heavy/low-volume days.
+    return WeekLoad("Undulating", ((-1, 1), (0, 0), (1, -1)))
+
+
+def _block(week: int, meso: int, position: int) -> WeekLoad:
+    # One emphasis per mesocycle, cycling through the three blocks.
+    block = meso % len(BLOCK_PHASES)
+    return WeekLoad(BLOCK_PHASES[block], ((block - 1, 1 - block),))
+
+
+PERIODIZATION_MODELS = {
+    "linear": _linear,
+    "undulating": _undulating,
+    "block": _block,
+}
+
+
+def week_load(week: int, model: str = "linear", deload_every: int = DELOAD_EVERY) -> WeekLoad:
+    """
+    The load of week `week` (1-based) under `model`. Weeks run in
+    mesocycles of `deload_every` weeks whose last week is a deload;
+    deload_every=0 never deloads and keeps progressing.
+    """
+    if model not in PERIODIZATION_MODELS:
+        raise ValueError(
+            f"Unknown periodization model {model!r}; use one of {', '.join(PERIODIZATION_MODELS)}."
+        )
+    index = week - 1
+    if deload_every > 1:
+        meso, position = divmod(index, deload_every)
+        if position == deload_every - 1:
+            return WeekLoad("Deload", deload=True)
+    else:
+        # No deloads: progression runs on through the whole program, and
+        # blocks still change every DELOAD_EVERY weeks.
+        meso, position = index // DELOAD_EVERY, index
+    return PERIODIZATION_MODELS[model](index, meso, position)
+
+
+# ============================
+# Lazy Weeks
+# ============================
+@dataclass(slots=True)
+class PlanWeek:
+    """One week of a periodized program: a single-week expanded WorkoutPlan."""
+
+    number: int
+    phase: str
+    plan: WorkoutPlan
+    deload: bool = False
+
+    def render(self) -> str:
+        return f"Week {self.number} — {self.phase}\n\n{self.plan.render()}\n"
+
+
+def _load_exercise(ex: Exercise, shift: int, set_change: int, deload: bool) -> Exercise:
+    if ex.sets is None:
+        return ex
+    if deload:
+        return Exercise(ex.name, max(1, (ex.sets + 1) // 2), ex.reps, ex.muscles)
+    reps = ex.reps
+    if reps in REP_RANGES:
+        rung = min(max(REP_RANGES.index(reps) + shift, 0), len(REP_RANGES) - 1)
+        reps = REP_RANGES[rung]
+    return Exercise(ex.name, max(1, ex.sets + set_change), reps, ex.muscles)
+
+
+def _load_day(day: WorkoutDay, shift: int, set_change: int, deload: bool) -> WorkoutDay:
+    if not (shift or set_change or deload):
+        return day
+
+    def compute() -> WorkoutDay:
+        return WorkoutDay(
+            number=day.number,
+            label=day.label,
+            scheme=f"{day.scheme} (deload)" if deload else day.scheme,
+            exercises=[_load_exercise(ex, shift, set_change, deload) for ex in day.exercises],
+            heading=None if deload else day.heading,
+        )
+
+    return _LOADED_DAYS.get_or_compute((day.fingerprint, shift, set_change, deload), compute)
+
+
+def iter_weeks(
+    plan: WorkoutPlan,
+    weeks: int,
+    model: str = "linear",
+    deload_every: int = DELOAD_EVERY,
+) -> Iterator[PlanWeek]:
+    """
+    Yields `weeks` periodized weeks of an expanded single-week plan, one at
+    a time.
+
+    Role:
+      - Nothing is built before it is asked for, so a 52-week program costs
+        one week of memory at a time, whatever consumes it.
+      - Each day's sets and rep range follow week_load(); the split itself
+        never changes.
+      - Loaded days are cached by content, so the repeated weeks of a
+        program (and of every member with the same plan) share day objects.
+    """
+    for number in range(1, weeks + 1):
+        load = week_load(number, model, deload_every)
+        days = [
+            _load_day(day, *load.day_loads[i % len(load.day_loads)], load.deload)
+            for i, day in enumerate(plan.days)
+        ]
+        yield PlanWeek(
+            number=number,
+            phase=load.phase,
+            plan=WorkoutPlan(
+                goal=plan.goal,
+                days=days,
+                days_per_week=len(days),
+                expanded=plan.expanded,
+            ),
+            deload=load.deload,
+        )
+
+
+# ============================
+# Stream Consumers
+# ============================
+def render_weeks(weeks: Iterable[PlanWeek]) -> Iterator[str]:
+    """The program's text one week at a time, e.g. for out.writelines()."""
+    for week in weeks:
+        yield week.render()
+
+
+def _week_report(
+    cache: DayCache, tool: Any, days: Sequence[WorkoutDay], lead_in: int = 0
+) -> str:
+    # Keyed by the tool instance: tools of one name may be configured
+    # differently (e.g. RecoveryBalanceTool(recovery_hours=...)).
+    key = (id(tool), tuple(day.fingerprint for day in days), lead_in)
+
+    def compute() -> str:
+        plan = WorkoutPlan(goal=None, days=list(days), expanded=True)
+        return tool.analyze(plan, lead_in=lead_in) if lead_in else tool.analyze(plan)
+
+    return cache.get_or_compute(key, compute)
+
+
+def validate_weeks(
+    weeks: Iterable[PlanWeek],
+    tools: Sequence[Any],
+    across_weeks: Sequence[str] = ("recovery_balance_validator",),
+    cache: Optional[DayCache] = None,
+) -> Iterator[Tuple[PlanWeek, Dict[str, str]]]:
+    """
+    Runs validators (anything with name and analyze(plan)) over a stream of
+    weeks, yielding each week with its {tool name: report}.
+
+    Tools named in `across_weeks` see the previous week too, as lead-in
+    (analyze(plan, lead_in=...)), so recovery is checked across the week
+    boundary while the previous week's own findings are not reported again.
+    Reports are cached by tool and the days it saw, so the repeated weeks of
+    a long program cost one lookup each. Pass the same `cache` to calls with
+    the same `tools` to share reports across programs; the cache belongs to
+    those tool instances and should not outlive them.
+    """
+    cache = cache if cache is not None else DayCache()
+    previous: List[WorkoutDay] = []
+    for week in weeks:
+        reports = {}
+        for tool in tools:
+            if tool.name in across_weeks:
+                reports[tool.name] = _week_report(
+                    cache, tool, previous + week.plan.days, len(previous)
+                )
+            else:
+                reports[tool.name] = _week_report(cache, tool, week.plan.days)
+        previous = week.plan.days
+        yield week, reports
+
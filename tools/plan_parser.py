@@ -0,0 +1,84 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from tools.workout_plan import Exercise, WorkoutDay, WorkoutPlan
+
+_HEADER = re.compile(r"workout plan\s*\((\d+) days?\)(?:.*?goal:\s*(\w+))?")
+# Leading list marker of a reformatted exercise line: "-", "*", "+" or "1.".
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s*")
+
+
+def _parse_heading(raw: str) -> WorkoutDay:
+    heading = raw.strip()
+    number = None
+    label = None
+    scheme = ""
+    if ":" in heading:
+        before_colon, after_colon = heading.split(":", 1)
+        digits = before_colon[3:].strip()
+        number = int(digits) if digits.isdigit() else None
+        # "Day X: Label — scheme"
+        label_part, _, scheme = after_colon.partition("—")
+        label = label_part.strip()
+        scheme = scheme.strip()
+    return WorkoutDay(number=number, label=label, scheme=scheme, heading=raw)
+
+
+def _parse_sets(line: str) -> int:
+    # naive parse: "5 sets × ..." -> 5; assume moderate volume if unparsable
+    parts = line.split("sets")[0].strip().split()
+    try:
+        return int(parts[-1])
+    except (ValueError, IndexError):
+        return 4
+
+
+def _parse_exercise(line: str, original: str) -> Exercise:
+    if "•" in original:
+        body = original.split("•", 1)[1].strip()
+    else:
+        body = _LIST_MARKER.sub("", original, count=1).strip()
+    name, _, scheme = body.partition("—")
+    sets: Optional[int] = _parse_sets(line) if "sets" in line else None
+    reps = scheme.split("×", 1)[1].strip() if "×" in scheme else ""
+    return Exercise(name=name.strip(), sets=sets, reps=reps)
+
+
+@lru_cache(maxsize=512)
+def parse_plan(plan_text: str) -> WorkoutPlan:
+    """
+    Builds a WorkoutPlan from plan text (e.g. written back by an LLM) in one
+    pass over its lines.
+
+    Role:
+      - Day headings are lines starting with "day" (any case, any indent).
+      - "•" lines become exercises of the current day, as does any other
+        line there that mentions "sets" (LLMs often reformat the bullets as
+        "-" or "*"), so its volume still counts.
+      - A "Workout Plan (N days) — Goal: x" header sets days_per_week/goal.
+
+    Memoized on the text, so every tool looking at the same plan shares one
+    parse. The returned plan is shared; treat it as read-only.
+    """
+    plan = WorkoutPlan(goal=None)
+    current = None
+
+    for original in plan_text.splitlines():
+        line = original.strip().lower()
+        if not line:
+            continue
+        if line.startswith("day"):
+            current = _parse_heading(original)
+            plan.days.append(current)
+        elif current is not None:
+            if "•" in line or "sets" in line:
+                current.exercises.append(_parse_exercise(line, original))
+        elif line.startswith("workout plan"):
+            header = _HEADER.match(line)
+            if header:
+                plan.days_per_week = int(header.group(1))
+                plan.goal = header.group(2)
+
+    plan.expanded = any(day.exercises for day in plan.days)
+    return plan
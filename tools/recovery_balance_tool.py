@@ -1,53 +1,100 @@
+from typing import Dict, List, Optional
+
 from fairlib.core.interfaces.tools import AbstractTool
 
+from tools.batch import BatchToolMixin
+from tools.muscles import MUSCLES, mask_columns
+from tools.plan_parser import parse_plan
+from tools.tool_input import PLAN_TEXT_INPUT, decode_tool_input
+from tools.workout_plan import WorkoutPlan
+
+# Hours each muscle needs before it is trained hard again.
+RECOVERY_HOURS = {
+    "chest": 48,
+    "back": 48,
+    "shoulders": 48,
+    "biceps": 48,
+    "triceps": 48,
+    "legs": 72,
+    "glutes": 72,
+    "hamstrings": 72,
+    "calves": 24,
+    "core": 24,
+}
+SESSION_GAP_HOURS = 24  # consecutive plan days are assumed to be on consecutive days
+WEEK_HOURS = 7 * 24
+
 
-class RecoveryBalanceTool(AbstractTool):
+class RecoveryBalanceTool(BatchToolMixin, AbstractTool):
     """
     Checks basic recovery / balance properties of a workout split.
 
+    Role:
+      - Flags consecutive days with the same split label.
+      - Tracks when each muscle was last trained, in one sweep over the days,
+        and flags muscles trained again inside their recovery window (e.g.
+        Push followed by Chest/Triceps). Plan days are taken as consecutive
+        days, and a week restarts when the day numbering does, so multi-week
+        plans are checked across week boundaries too.
+
     Input: full workout plan as text.
     Output: brief analysis of repeated days and rough recovery spacing.
+
+    Args:
+      recovery_hours: Per-muscle overrides of RECOVERY_HOURS.
     """
 
     name = "recovery_balance_validator"
     description = (
         "Given a workout plan as text, inspect the sequence of training days "
         "and look for consecutive identical splits (e.g., Upper/Upper or Legs/Legs "
-        "back-to-back). Reports potential recovery issues and general balance."
+        "back-to-back) and muscles trained again before they have recovered "
+        "(48–72h). Reports potential recovery issues and general balance."
     )
+    input_schema = PLAN_TEXT_INPUT
+
+    def __init__(self, recovery_hours: Optional[Dict[str, float]] = None):
+        hours = {**RECOVERY_HOURS, **(recovery_hours or {})}
+        self.windows = [hours[name] for name in MUSCLES]
 
     def use(self, tool_input: str) -> str:
-        plan_text = tool_input.lower()
-        day_lines = [
-            line.strip()
-            for line in plan_text.splitlines()
-            if line.strip().startswith("day")
-        ]
+        plan_text = decode_tool_input(tool_input, self.input_schema)["plan"]
+        return self.analyze(parse_plan(plan_text))
+
+    def batch_outputs(self, inputs):
+        plans = [parse_plan(data["plan"]) for data in inputs]
+        return [self.analyze(plan) for plan in plans]
+
+    def analyze(self, plan: WorkoutPlan, lead_in: int = 0) -> str:
+        """
+        Structured form of use(): the report for a WorkoutPlan.
 
-        split_labels = []
-        for line in day_lines:
-            # "Day X: Label — ..."
-            if ":" in line:
-                after_colon = line.split(":", 1)[1]
-                label = after_colon.split("—")[0].split("-")[0].strip()
-                split_labels.append(label.lower())
+        The first `lead_in` days are context only (e.g. the previous week of
+        a program): later days are checked against them, but findings among
+        them alone are not reported again.
+        """
+        day_lines = [day.title.strip().lower() for day in plan.days]
+        split_labels = plan.labels
+        first = sum(day.label is not None for day in plan.days[:lead_in])  # labels of lead-in days
 
-        if not split_labels:
+        if not split_labels[first:]:
             return (
                 "Recovery analysis: could not detect day-by-day splits in the plan text."
             )
 
         issues = []
-        for i in range(1, len(split_labels)):
+        for i in range(max(first, 1), len(split_labels)):
             if split_labels[i] == split_labels[i - 1]:
                 issues.append(
                     f"- {day_lines[i-1]} and {day_lines[i]} train the same split back-to-back, "
                     "which may not allow enough recovery."
                 )
 
+        issues.extend(self._recovery_window_issues(plan, lead_in))
+
         # Simple heuristic for balance: see how many unique labels vs total days.
-        unique_labels = set(split_labels)
-        if len(unique_labels) == 1 and len(split_labels) > 1:
+        unique_labels = set(split_labels[first:])
+        if len(unique_labels) == 1 and len(split_labels) - first > 1:
             issues.append(
                 "- All days use the same split label, which is likely unbalanced."
             )
@@ -55,8 +102,60 @@ class RecoveryBalanceTool(AbstractTool):
         if not issues:
             return (
                 "Recovery analysis: No obvious back-to-back duplicate splits detected. "
-                "The split appears reasonably balanced with respect to recovery based on labels alone."
+                "The split appears reasonably balanced with respect to recovery, "
+                "and no muscle is trained again inside its recovery window."
             )
 
         header = "Recovery / Balance Analysis:\n"
         return header + "\n".join(issues)
+
+    def _recovery_window_issues(self, plan: WorkoutPlan, lead_in: int = 0) -> List[str]:
+        """
+        One pass over the days, O(days × muscles): the day each muscle was
+        last trained is the only state carried forward. Days before `lead_in`
+        only set that state.
+        """
+        windows = self.windows
+        last_day: List[Optional[int]] = [None] * len(MUSCLES)  # per muscle
+        day_hours = []                     # hour each day starts
+        titles = [day.title.strip().lower() for day in plan.days]
+        findings: Dict[str, int] = {}      # issue line -> occurrences, in order
+
+        week_start = 0
+        prev_number = None
+        hour = -SESSION_GAP_HOURS
+        for i, day in enumerate(plan.days):
+            if day.number is None:
+                hour += SESSION_GAP_HOURS
+            else:
+                if prev_number is not None and day.number <= prev_number:
+                    week_start += WEEK_HOURS
+                hour = week_start + (day.number - 1) * SESSION_GAP_HOURS
+                prev_number = day.number
+            day_hours.append(hour)
+
+            # Muscles trained too soon, grouped by the day that trained them before.
+            too_soon: Dict[int, List[int]] = {}
+            for m in mask_columns(day.mask):
+                j = last_day[m]
+                if j is not None and hour - day_hours[j] < windows[m]:
+                    too_soon.setdefault(j, []).append(m)
+                last_day[m] = i
+            if i < lead_in:
+                continue
+
+            for j, muscles in too_soon.items():
+                before = plan.days[j]
+                if j == i - 1 and before.label is not None and before.key == day.key:
+                    continue  # reported as a back-to-back duplicate split
+                line = (
+                    f"- {titles[i]} trains {', '.join(sorted(MUSCLES[m] for m in muscles))} "
+                    f"{hour - day_hours[j]:g}h after {titles[j]}, inside their "
+                    f"{max(windows[m] for m in muscles):g}h recovery window."
+                )
+                findings[line] = findings.get(line, 0) + 1
+
+        return [
+            line + (f" (repeats {count}×)" if count > 1 else "")
+            for line, count in findings.items()
+        ]
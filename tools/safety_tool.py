@@ -1,7 +1,19 @@
+from typing import Optional, Tuple
+
 from fairlib.core.interfaces.tools import AbstractTool
 
+from tools.batch import BatchToolMixin
+from tools.day_cache import DayCache
+from tools.plan_parser import parse_plan
+from tools.tool_input import PLAN_TEXT_INPUT, decode_tool_input
+from tools.volume import VolumeMatrix, volume_matrices, volume_matrix
+from tools.workout_plan import WorkoutDay, WorkoutPlan
+
+# Day fingerprint -> that day's (squat/deadlift, volume) warnings.
+_DAY_WARNINGS = DayCache()
+
 
-class SafetyCheckTool(AbstractTool):
+class SafetyCheckTool(BatchToolMixin, AbstractTool):
     """
     Performs simple heuristic safety checks on a workout plan.
 
@@ -19,70 +31,37 @@ class SafetyCheckTool(AbstractTool):
         "Analyze a workout plan for basic safety concerns and overuse risks. "
         "Input is the full expanded workout plan text."
     )
+    input_schema = PLAN_TEXT_INPUT
 
     def use(self, tool_input: str) -> str:
-        plan = tool_input.lower()
-        lines = [l for l in plan.splitlines() if l.strip()]
-
-        warnings = []
-
-        # 1) Check for days with both squats and deadlifts
-        current_day = None
-        day_block_exercises = []
-
-        def check_day(day_name, exercises):
-            ex_text = " ".join(exercises)
-            if "squat" in ex_text and "deadlift" in ex_text:
-                return (
-                    f"- {day_name} includes both squats and deadlifts. "
-                    "For many lifters this is very taxing on the lower back—"
-                    "consider separating them across different days or reducing volume."
-                )
-            return None
-
-        for line in lines:
-            if line.lower().startswith("day"):
-                # new day – evaluate previous
-                if current_day is not None:
-                    msg = check_day(current_day, day_block_exercises)
-                    if msg:
-                        warnings.append(msg)
-                current_day = line.strip()
-                day_block_exercises = []
-            elif "•" in line:
-                day_block_exercises.append(line)
-
-        # check last day
-        if current_day is not None:
-            msg = check_day(current_day, day_block_exercises)
-            if msg:
-                warnings.append(msg)
-
-        # 2) Rough check on total set volume per day
-        #    If more than ~24 work sets appear on any day, flag it.
-        day_sets = {}
-        current_day = None
-
-        for line in lines:
-            if line.lower().startswith("day"):
-                current_day = line.strip()
-                day_sets[current_day] = 0
-            elif "sets" in line and current_day is not None:
-                # naive parse: "5 sets × ..."
-                parts = line.split("sets")[0].strip().split()
-                try:
-                    num_sets = int(parts[-1])
-                except (ValueError, IndexError):
-                    num_sets = 4  # assume moderate if we can't parse
-                day_sets[current_day] += num_sets
-
-        for day, total in day_sets.items():
-            if total > 24:
-                warnings.append(
-                    f"- {day} appears to have around {total} total sets. "
-                    "This may be high for many lifters; consider lowering volume or "
-                    "splitting the work across more days."
-                )
+        plan_text = decode_tool_input(tool_input, self.input_schema)["plan"]
+        return self.analyze(parse_plan(plan_text))
+
+    def batch_outputs(self, inputs):
+        plans = [parse_plan(data["plan"]) for data in inputs]
+        return [
+            self.analyze(plan, volume)
+            for plan, volume in zip(plans, volume_matrices(plans))
+        ]
+
+    def analyze(self, plan: WorkoutPlan, volume: Optional[VolumeMatrix] = None) -> str:
+        """
+        Structured form of use(): the safety notes for a WorkoutPlan.
+        `volume` is the plan's VolumeMatrix when the caller already has it.
+        """
+        # Warnings are worked out per day and cached by the day's fingerprint;
+        # the report lists every day's first check, then every day's second.
+        day_warnings = []
+        for i, day in enumerate(plan.days):
+            fingerprint = day.fingerprint
+            piece = _DAY_WARNINGS.get(fingerprint)
+            if piece is None:
+                if volume is None:
+                    volume = volume_matrix(plan)
+                piece = self._check_day(day, volume.day_sets[i])
+                _DAY_WARNINGS.put(fingerprint, piece)
+            day_warnings.append(piece)
+        warnings = [w for w, _ in day_warnings if w] + [w for _, w in day_warnings if w]
 
         if not warnings:
             return (
@@ -102,3 +81,28 @@ class SafetyCheckTool(AbstractTool):
             "medical professional if you have injuries or concerns."
         )
         return header + "\n".join(warnings) + disclaimer
+
+    @staticmethod
+    def _check_day(day: WorkoutDay, total_sets: float) -> Tuple[Optional[str], Optional[str]]:
+        """(squat/deadlift warning, volume warning) for one day; None when clear."""
+        title = day.title.strip().lower()
+        combo = volume_warning = None
+
+        # 1) Check for days with both squats and deadlifts
+        ex_text = " ".join(ex.name for ex in day.exercises).lower()
+        if "squat" in ex_text and "deadlift" in ex_text:
+            combo = (
+                f"- {title} includes both squats and deadlifts. "
+                "For many lifters this is very taxing on the lower back—"
+                "consider separating them across different days or reducing volume."
+            )
+
+        # 2) Rough check on total set volume per day
+        #    If more than ~24 work sets appear on any day, flag it.
+        if total_sets > 24:
+            volume_warning = (
+                f"- {title} appears to have around {int(total_sets)} total sets. "
+                "This may be high for many lifters; consider lowering volume or "
+                "splitting the work across more days."
+            )
+        return combo, volume_warning
@@ -0,0 +1,360 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from typing import FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from tools.exercise_catalog import MUSCLE_ALIASES
+from tools.exercise_generator_tool import ExerciseGeneratorTool
+from tools.muscle_coverage_tool import CORE, REQUIRED_MUSCLES
+from tools.muscles import MUSCLES, label_mask, mask_columns
+from tools.recovery_balance_tool import RECOVERY_HOURS, SESSION_GAP_HOURS, WEEK_HOURS
+from tools.volume import volume_matrix
+from tools.workout_plan import WorkoutDay, WorkoutPlan
+
+MAX_DAYS = 7
+
+# Day types the optimizer can schedule, one per distinct set of muscles.
+# "Legs" is renamed "Lower" next to an "Upper" day, and "Pull" becomes
+# "Back/Biceps" next to "Chest/Triceps", as the classic splits name them.
+DAY_TYPES = (
+    "Upper", "Legs", "Push", "Pull", "Chest/Triceps",
+    "Shoulders", "Arms", "Glutes/Hamstrings", "Full Body",
+)
+
+# The splits the planner used to hand out. Ties go to the closest of these,
+# and a result with the same days keeps their names.
+CLASSIC_SPLITS = {
+    2: ["Upper Body", "Lower Body"],
+    3: ["Push", "Pull", "Legs"],
+    4: ["Upper", "Lower", "Push", "Pull"],
+    5: ["Push", "Pull", "Legs", "Upper", "Lower"],
+    6: ["Chest/Triceps", "Back/Biceps", "Legs", "Shoulders", "Arms", "Glutes/Hamstrings"],
+}
+
+POSTERIOR_CHAIN = ("back", "glutes", "hamstrings")
+
+# Sessions a week per muscle, and weighted work sets a week past which more
+# volume stops paying off. Emphasized muscles get one more session and half
+# again the sets; de-emphasized ones one session less.
+TARGET_FREQUENCY = 2
+MAX_WEEKLY_SETS = 20
+SESSION_SETS = 4  # weighted sets that make a day count as training a muscle
+# A muscle trained inside its recovery window costs as much as this many
+# sessions off target.
+RECOVERY_WEIGHT = 4
+
+_TYPE_MASKS = tuple(label_mask(name) for name in DAY_TYPES)
+_TYPE_COLUMNS = tuple(mask_columns(mask) for mask in _TYPE_MASKS)
+_UPPER, _LEGS, _PULL, _CHEST_TRICEPS = (
+    DAY_TYPES.index(name) for name in ("Upper", "Legs", "Pull", "Chest/Triceps")
+)
+_WINDOWS = tuple(RECOVERY_HOURS[name] for name in MUSCLES)
+_LOOKBACK = (max(_WINDOWS) - 1) // SESSION_GAP_HOURS  # earlier days never violate
+# Recovery windows in days, and days in the weekly cycle.
+_SPACING = np.array([-(-w // SESSION_GAP_HOURS) for w in _WINDOWS])
+_CYCLE = WEEK_HOURS // SESSION_GAP_HOURS
+# Muscles whose weekly frequency counts towards balance (core is covered by
+# any Upper day, as the coverage validator counts it).
+_BALANCE_COLUMNS = list(mask_columns(REQUIRED_MUSCLES & ~CORE))
+
+
+# ============================
+# Constraints
+# ============================
+@dataclass(frozen=True)
+class SplitConstraints:
+    """
+    Preferences parsed from free-text instructions.
+
+    emphasis holds a weight per MUSCLES column (more frequency is better for
+    positive weights, worse for negative ones); avoid names day types that
+    must not be scheduled.
+    """
+
+    emphasis: Tuple[float, ...] = (0.0,) * len(MUSCLES)
+    avoid: FrozenSet[str] = frozenset()
+
+
+_MORE = re.compile(r"\b(?:more|extra|focus(?:ing)? on|emphasi[sz]e|prioriti[sz]e)\s+(?:the\s+|my\s+)?([a-z]+)")
+_LESS = re.compile(r"\b(?:less|avoid|no|skip|without)\s+(?:the\s+|my\s+)?([a-z]+)")
+_AVOID_OVERHEAD = re.compile(r"\b(?:avoid|no|skip|without)\b[^.,;]*\boverhead")
+
+
+def _muscles_named(word: str) -> Tuple[str, ...]:
+    word = MUSCLE_ALIASES.get(word, word)
+    if word == "arms":
+        return ("biceps", "triceps")
+    if word.rstrip("s") + "s" in MUSCLES:
+        word = word.rstrip("s") + "s"
+    return (word,) if word in MUSCLES else ()
+
+
+@lru_cache(maxsize=256)
+def parse_constraints(text: str) -> SplitConstraints:
+    """
+    Reads split preferences from instructions like "avoid overhead movements"
+    or "focus more on posterior chain".
+
+    Role:
+      - "more / focus on / prioritize <muscle>" raises that muscle's weight;
+        "less / avoid / no <muscle>" lowers it. "posterior chain" means back,
+        glutes and hamstrings.
+      - "avoid overhead" drops the Shoulders day and lowers shoulder volume.
+      - "no <day type>" (e.g. "no arms day") drops that day type.
+    Anything else is ignored; exercise-level wishes are the generator's job.
+    Pass only text given as constraints (a form field, a tool argument),
+    never a whole request: incidental words there would become preferences.
+    """
+    text = text.lower()
+    emphasis = dict.fromkeys(MUSCLES, 0.0)
+    avoid = set()
+
+    if "posterior chain" in text:
+        sign = -1.0 if re.search(r"\b(?:less|avoid|no)\s+(?:the\s+)?posterior chain", text) else 1.0
+        for name in POSTERIOR_CHAIN:
+            emphasis[name] += sign
+    if _AVOID_OVERHEAD.search(text):
+        avoid.add("Shoulders")
+        emphasis["shoulders"] -= 1.0
+
+    for pattern, weight in ((_MORE, 1.0), (_LESS, -1.0)):
+        for match in pattern.finditer(text):
+            word = match.group(1)
+            for name in _muscles_named(word):
+                emphasis[name] += weight
+            if weight < 0 and not match.group(0).startswith("less"):
+                avoid.update(t for t in DAY_TYPES if t.lower() == word or t.lower().rstrip("s") == word)
+
+    return SplitConstraints(emphasis=tuple(emphasis[name] for name in MUSCLES), avoid=frozenset(avoid))
+
+
+# ============================
+# Search
+# ============================
+def _too_close(days_apart: int) -> int:
+    """Bits (by MUSCLES column) of the muscles still recovering after `days_apart` days."""
+    return sum(1 << m for m, window in enumerate(_WINDOWS) if days_apart * SESSION_GAP_HOURS < window)
+
+
+@lru_cache(maxsize=None)
+def _label_volume(label: str) -> np.ndarray:
+    """
+    Weighted sets per muscle (MUSCLES columns) of one day with this label,
+    as the exercise generator expands it for hypertrophy.
+    """
+    day = WorkoutDay(number=1, label=label)
+    plan = ExerciseGeneratorTool().expand(WorkoutPlan(goal=None, days=[day]), "hypertrophy")
+    return volume_matrix(plan).weekly
+
+
+def _expanded_totals(counts: np.ndarray, per_day) -> np.ndarray:
+    """
+    Weekly totals per muscle of each multiset (rows of `counts`), summing
+    per_day(_label_volume(label)) over its days under the names _name_days()
+    gives them.
+    """
+    totals: np.ndarray = counts @ np.array([per_day(_label_volume(name)) for name in DAY_TYPES])
+    for renamed, name, next_to in ((_LEGS, "Lower", _UPPER), (_PULL, "Back/Biceps", _CHEST_TRICEPS)):
+        change = per_day(_label_volume(name)) - per_day(_label_volume(DAY_TYPES[renamed]))
+        totals += np.outer(np.where(counts[:, next_to] > 0, counts[:, renamed], 0), change)
+    return totals
+
+
+_TYPE_BITS = tuple(sum(1 << m for m in columns) for columns in _TYPE_COLUMNS)
+_TOO_CLOSE = tuple(_too_close(days_apart) for days_apart in range(_CYCLE + 1))
+
+# Day type of each day of a classic split; None where no type matches it.
+Template = Tuple[Optional[int], ...]
+
+
+@lru_cache(maxsize=4096)
+def _best_order(counts: Tuple[int, ...], template: Optional[Template], bound: int) -> Tuple[int, Optional[Tuple[int, ...]]]:
+    """
+    Orders a multiset of day types (one per consecutive day) with the fewest
+    recovery violations, counted like RecoveryBalanceTool does: a muscle
+    trained inside its window since its last session, including next week's
+    first session against this week's last. Ties go to the order closest to
+    `template`.
+
+    Branch-and-bound over permutations: violations are counted exactly as
+    days are placed (a next-week violation is certain once a muscle is placed
+    too close to its first session), so partial orders that cannot beat the
+    best are cut. Returns (violations, order), or (bound + 1, None) if no
+    order beats `bound`.
+    """
+    days = sum(counts)
+    ideal = days if template else 0
+    # The incumbent: fewest violations, its order, and its template matches.
+    best_violations = bound + 1
+    best_order: Optional[Tuple[int, ...]] = None
+    best_matches = -1
+    remaining = list(counts)
+    order: List[int] = []
+    firsts: List[int] = []  # bits of the muscles first trained on each early day
+
+    def extend(violations: int, matches: int, seen: int, wrapped: int):
+        nonlocal best_violations, best_order, best_matches
+        day = len(order)
+        if day == days:
+            if violations < best_violations or matches > best_matches:
+                best_violations, best_order, best_matches = violations, tuple(order), matches
+            return
+        for day_type, left in enumerate(remaining):
+            if not left:
+                continue
+            bits = _TYPE_BITS[day_type]
+            added = 0
+            shared_seen = 0
+            for back in range(1, min(day, _LOOKBACK) + 1):
+                shared = bits & _TYPE_BITS[order[-back]] & ~shared_seen
+                added += (shared & _TOO_CLOSE[back]).bit_count()
+                shared_seen |= shared
+            if day < _LOOKBACK:
+                firsts.append(bits & ~seen)
+            wrap = 0
+            for first_day, first_bits in enumerate(firsts):
+                wrap |= bits & first_bits & _TOO_CLOSE[_CYCLE + first_day - day]
+            wrap &= ~wrapped
+            added += wrap.bit_count()
+
+            total = violations + added
+            if total < best_violations or (total == best_violations and best_order is not None):
+                remaining[day_type] -= 1
+                order.append(day_type)
+                hit = template is not None and template[day] == day_type
+                extend(total, matches + hit, seen | bits, wrapped | wrap)
+                order.pop()
+                remaining[day_type] += 1
+            if day < _LOOKBACK:
+                firsts.pop()
+            if best_violations == 0 and best_matches == ideal:
+                return
+
+    extend(0, 0, 0, 0)
+    return best_violations, best_order
+
+
+def _template_types(days: int) -> Optional[Template]:
+    names = CLASSIC_SPLITS.get(days)
+    if names is None:
+        return None
+    by_mask = {mask: i for i, mask in reversed(list(enumerate(_TYPE_MASKS)))}
+    return tuple(by_mask.get(label_mask(name)) for name in names)
+
+
+def _name_days(order: Tuple[int, ...]) -> List[str]:
+    template = CLASSIC_SPLITS.get(len(order))
+    if template and tuple(_TYPE_MASKS[t] for t in order) == tuple(label_mask(n) for n in template):
+        return list(template)
+    names = [DAY_TYPES[t] for t in order]
+    if "Upper" in names:
+        names = ["Lower" if n == "Legs" else n for n in names]
+    if "Chest/Triceps" in names:
+        names = ["Back/Biceps" if n == "Pull" else n for n in names]
+    return names
+
+
+@lru_cache(maxsize=256)
+def optimize_split(days: int, constraints: SplitConstraints = SplitConstraints()) -> Tuple[str, ...]:
+    """
+    The best split (one label per training day) for `days` days a week.
+
+    Ranked, in order:
+      1. fewest required muscle groups missing (MuscleCoverageValidatorTool's
+         rules);
+      2. lowest cost: RECOVERY_WEIGHT per recovery-window violation
+         (RecoveryBalanceTool's windows, days taken as consecutive, into the
+         following week too), plus one per session a muscle is off its
+         weekly target: short of TARGET_FREQUENCY sessions, over them, or
+         SESSION_SETS sets past MAX_WEEKLY_SETS, counted on the days as the
+         generator expands them (weighted by emphasis);
+      3. fewest sessions off target, then most weight on the emphasized
+         muscles;
+      4. the smallest gap between most- and least-trained muscle groups;
+      5. most distinct day types, then closest to the classic split.
+
+    Everything but the violations is independent of day order, so every
+    multiset of day types is scored at once with NumPy, along with a lower
+    bound on its violations. Multisets are then tried best-first by the
+    bound on their cost, and ordered by branch-and-bound only while that
+    bound can still beat the best split found. Results are memoized per
+    (days, constraints).
+    """
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_DAYS}, got {days}.")
+
+    allowed = [t for t, name in enumerate(DAY_TYPES) if name not in constraints.avoid]
+    if not allowed:
+        allowed = list(range(len(DAY_TYPES)))
+
+    picks = np.array(list(combinations_with_replacement(allowed, days)))
+    counts = np.zeros((len(picks), len(DAY_TYPES)), dtype=np.int64)
+    np.add.at(counts, (np.repeat(np.arange(len(picks)), days), picks.ravel()), 1)
+
+    incidence = np.zeros((len(DAY_TYPES), len(MUSCLES)))
+    for t, columns in enumerate(_TYPE_COLUMNS):
+        incidence[t, list(columns)] = 1
+    frequency = counts @ incidence
+
+    type_masks = np.array(_TYPE_MASKS, dtype=np.int64)
+    covered = np.bitwise_or.reduce(np.where(counts > 0, type_masks, 0), axis=1)
+    covered = np.where(counts[:, _UPPER] > 0, covered | CORE, covered)
+    uncovered = REQUIRED_MUSCLES & ~covered
+    missing = sum((uncovered >> bit) & 1 for bit in range(REQUIRED_MUSCLES.bit_length()))
+
+    # Fewest violations any order can reach: a muscle trained c times a week
+    # with a window of s days leaves v gaps shorter than s, where
+    # v + (c - v) * s <= 7.
+    spaced = _SPACING > 1
+    floor = np.ceil(
+        (frequency[:, spaced] * _SPACING[spaced] - _CYCLE) / (_SPACING[spaced] - 1)
+    ).clip(min=0).sum(axis=1)
+
+    weights = np.asarray(constraints.emphasis)
+    emphasis = frequency @ weights
+    # Sessions and sets each muscle gets once the days are expanded
+    # (secondary work included), against its weekly targets.
+    volume = _expanded_totals(counts, lambda sets: sets)
+    sessions = _expanded_totals(counts, lambda sets: (sets >= SESSION_SETS).astype(float))
+    target = (TARGET_FREQUENCY + np.sign(weights)).clip(min=1)
+    max_sets = np.where(weights > 0, MAX_WEEKLY_SETS * 1.5, MAX_WEEKLY_SETS)
+    shortfall = (target - sessions).clip(min=0)
+    surplus = (sessions - target).clip(min=0)
+    surplus += np.ceil((volume - max_sets).clip(min=0) / SESSION_SETS)
+    # Emphasized muscles count double when short, de-emphasized ones when over.
+    off_target = (
+        (shortfall * (1 + weights.clip(min=0)))[:, _BALANCE_COLUMNS].sum(axis=1)
+        + (surplus * (1 + (-weights).clip(min=0))).sum(axis=1)
+    )
+    balance = sessions[:, _BALANCE_COLUMNS]
+    spread = balance.max(axis=1) - balance.min(axis=1)
+    distinct = (counts > 0).sum(axis=1)
+
+    template = _template_types(days)
+    template_counts = np.zeros(len(DAY_TYPES), dtype=np.int64)
+    typed = [t for t in template or () if t is not None]
+    if template and len(typed) == len(template):
+        np.add.at(template_counts, typed, 1)
+    off_template = np.abs(counts - template_counts).sum(axis=1)
+
+    bound = RECOVERY_WEIGHT * floor + off_target
+    # np.lexsort sorts by the last key first.
+    ranking = np.lexsort((off_template, -distinct, spread, -emphasis, off_target, bound, missing))
+
+    best_cost, best_order = None, None
+    for k in ranking:
+        if best_order is not None and (missing[k] > missing[ranking[0]] or bound[k] >= best_cost):
+            break  # nothing later can beat the best split
+        # Violations this multiset may have and still beat the best cost.
+        allowed_violations = (
+            MAX_DAYS * len(MUSCLES) if best_cost is None
+            else int(best_cost - off_target[k] - 1) // RECOVERY_WEIGHT
+        )
+        violations, order = _best_order(tuple(counts[k].tolist()), template, allowed_violations)
+        if order is not None:
+            best_cost, best_order = RECOVERY_WEIGHT * violations + off_target[k], order
+    assert best_order is not None  # the first multiset is searched without a bound
+    return tuple(_name_days(best_order))
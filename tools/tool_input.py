@@ -0,0 +1,127 @@
+import ast
+import json
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+_REQUIRED = object()
+
+
+class ToolInputError(ValueError):
+    """
+    Raised for tool input that cannot be decoded or fails the schema.
+
+    ToolExecutor turns it into an "Error executing tool ..." observation, so
+    the message is written for the LLM to fix its next call.
+    """
+
+
+class InputSchema:
+    """
+    Declares the fields a tool accepts.
+
+    Role:
+      - fields maps each name to (type, default); omit the default (a 1-tuple)
+        to make the field required. int fields also accept numeric strings
+        like "4", as the tools always have.
+      - text_field, if set, names the field that receives the input when it
+        is plain text rather than a dict (the validators take a bare plan).
+    """
+
+    def __init__(self, fields: Dict[str, Tuple], text_field: Optional[str] = None):
+        self.fields = {
+            name: (spec[0], spec[1] if len(spec) > 1 else _REQUIRED)
+            for name, spec in fields.items()
+        }
+        self.text_field = text_field
+
+    def validate(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        clean = {}
+        for name, (kind, default) in self.fields.items():
+            value = data.get(name)
+            if value is None:  # omitted or null
+                value = default
+            if value is _REQUIRED:
+                raise ToolInputError(f"Missing required field '{name}'.")
+            clean[name] = _check_type(name, value, kind)
+        return clean
+
+
+# The validators and the safety checker take a plan, bare or as {"plan": ...}.
+PLAN_TEXT_INPUT = InputSchema({"plan": (str,)}, text_field="plan")
+
+
+def _check_type(name: str, value: Any, kind: type) -> Any:
+    if kind is int:
+        if isinstance(value, bool):
+            raise ToolInputError(f"Field '{name}' must be an integer, got {value!r}.")
+        if isinstance(value, int):
+            return value
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ToolInputError(f"Field '{name}' must be an integer, got {value!r}.") from None
+    if not isinstance(value, kind):
+        raise ToolInputError(
+            f"Field '{name}' must be {kind.__name__}, got {type(value).__name__}."
+        )
+    return value
+
+
+def _strip_code_fence(text: str) -> str:
+    # LLMs like to wrap JSON in ```json ... ``` fences.
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def _parse_literal(text: str) -> Any:
+    """JSON first (fast path), then a Python literal; never runs code."""
+    # "{'days': ..." can only be a Python literal; skip the failing JSON try.
+    if text[1:].lstrip()[:1] != "'":
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _decode_cached(tool_input: str, schema: InputSchema) -> Tuple[Tuple[str, Any], ...]:
+    text = _strip_code_fence(tool_input.strip())
+    data = _parse_literal(text) if text[:1] in "{[\"'" else None
+
+    if isinstance(data, str) and schema.text_field is not None:
+        data = {schema.text_field: data}
+    elif not isinstance(data, dict):
+        if schema.text_field is None:
+            raise ToolInputError(
+                "Expected a JSON object or Python dict literal such as "
+                "{'days': 4, 'goal': 'strength'}."
+            )
+        # A bare plan (or a dict that failed to parse) is the text field itself.
+        data = {schema.text_field: tool_input}
+
+    return tuple(schema.validate(data).items())
+
+
+def decode_tool_input(tool_input: Any, schema: InputSchema) -> Dict[str, Any]:
+    """
+    Safely decodes an LLM-produced tool input against `schema`.
+
+    Accepts a JSON object, a Python dict literal (the format the tool
+    descriptions show), an already-decoded dict, or, for schemas with a
+    text_field, plain text. Nothing is ever eval()'d.
+
+    String inputs are cached by value, so the repeated calls an agent makes
+    with the same arguments decode once. Returns a fresh dict each call.
+    """
+    if isinstance(tool_input, Mapping):
+        return schema.validate(tool_input)
+    if not isinstance(tool_input, str):
+        raise ToolInputError(f"Unsupported tool input type {type(tool_input).__name__}.")
+    return dict(_decode_cached(tool_input, schema))
@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from tools.day_cache import DayCache
+from tools.exercise_catalog import get_catalog
+from tools.muscles import MUSCLES, names_of
+from tools.workout_plan import WorkoutDay, WorkoutPlan
+
+# A set counts fully for the primary muscle and half for each secondary.
+SECONDARY_WEIGHT = 0.5
+
+MUSCLE_INDEX = {name: i for i, name in enumerate(MUSCLES)}
+
+# Day fingerprint -> (weighted sets per muscle, total sets) of that day.
+_DAY_VOLUME = DayCache()
+_GROUP_MEMBERS = {"arms": ("biceps", "triceps")}
+
+
+@lru_cache(maxsize=4096)
+def _muscle_weights(muscles: Tuple[str, ...]) -> np.ndarray:
+    """Per-set contribution of one exercise to each muscle column."""
+    weights = np.zeros(len(MUSCLES))
+    for position, name in enumerate(muscles):
+        for member in _GROUP_MEMBERS.get(name, (name,)):
+            column = MUSCLE_INDEX.get(member)
+            if column is not None:
+                weight = 1.0 if position == 0 else SECONDARY_WEIGHT
+                weights[column] = max(weights[column], weight)
+    weights.flags.writeable = False
+    return weights
+
+
+def _exercise_muscles(name: str, day: WorkoutDay) -> Tuple[str, ...]:
+    # Plans parsed from text carry names only; look them up in the catalog
+    # and fall back to what the day's split label trains.
+    entry = get_catalog().get(name)
+    if entry is not None:
+        return entry.muscles
+    return names_of(day.mask)
+
+
+@dataclass(slots=True)
+class VolumeMatrix:
+    """
+    Set volume of a plan as a days × muscles matrix (columns: MUSCLES).
+
+    Every statistic is a single array reduction over the matrix.
+    """
+
+    sets: np.ndarray      # (days, muscles) weighted work sets
+    day_sets: np.ndarray  # (days,) raw work sets per session
+    weeks: int
+
+    @property
+    def weekly(self) -> np.ndarray:
+        """Weighted sets per muscle per week."""
+        return self.sets.sum(axis=0) / self.weeks
+
+    @property
+    def frequency(self) -> np.ndarray:
+        """Sessions per week that train each muscle."""
+        return np.count_nonzero(self.sets, axis=0) / self.weeks
+
+    @property
+    def peak_session(self) -> np.ndarray:
+        """Largest single-session volume for each muscle."""
+        if not len(self.sets):
+            return np.zeros(len(MUSCLES))
+        return self.sets.max(axis=0)
+
+    @staticmethod
+    def by_muscle(values: np.ndarray) -> Dict[str, float]:
+        """Non-zero entries of a per-muscle vector, keyed by muscle name."""
+        return {MUSCLES[i]: float(values[i]) for i in np.flatnonzero(values)}
+
+
+def _weeks(plan: WorkoutPlan) -> int:
+    if plan.days_per_week:
+        return max(1, len(plan.days) // plan.days_per_week)
+    # Expanded text has no header; each week restarts at "Day 1".
+    return max(1, sum(1 for day in plan.days if day.number == 1))
+
+
+def volume_matrix(plan: WorkoutPlan) -> VolumeMatrix:
+    """Builds the VolumeMatrix of an (expanded) plan."""
+    return volume_matrices([plan])[0]
+
+
+def volume_matrices(plans: List[WorkoutPlan]) -> List[VolumeMatrix]:
+    """
+    VolumeMatrix of every plan in a batch.
+
+    All plans' days are stacked into one matrix and each plan gets a row
+    slice (a view) of it. A day's row comes from the day cache when that
+    exact day was seen before (or repeats earlier in the batch); the
+    remaining days are computed together:
+    each exercise contributes sets × its muscle weights (looked up once per
+    distinct exercise), summed per day with a single np.add.at call.
+    """
+    offsets = [0]
+    fresh = []     # (matrix row, day, fingerprint) of days not in the cache
+    fresh_row = {}  # fingerprint -> its row in `fresh`, for repeats in the batch
+    repeats = []   # (matrix row, matrix row of the same fresh day)
+    cached = []    # (matrix row, (weighted sets row, total sets))
+    for plan in plans:
+        row = offsets[-1]
+        for i, day in enumerate(plan.days):
+            fingerprint = day.fingerprint
+            if fingerprint in fresh_row:
+                repeats.append((row + i, fresh_row[fingerprint]))
+                continue
+            piece = _DAY_VOLUME.get(fingerprint)
+            if piece is None:
+                fresh_row[fingerprint] = row + i
+                fresh.append((row + i, day, fingerprint))
+            else:
+                cached.append((row + i, piece))
+        offsets.append(row + len(plan.days))
+
+    sets = np.zeros((offsets[-1], len(MUSCLES)))
+    day_sets = np.zeros(offsets[-1])
+    for row, (weighted, total) in cached:
+        sets[row] = weighted
+        day_sets[row] = total
+
+    day_index = []
+    set_counts = []
+    weight_rows = []  # index into `weights` for each exercise
+    weights = []
+    row_of = {}       # batch-local: exercise -> its row in `weights`
+    for row, day, _ in fresh:
+        for ex in day.exercises:
+            if not ex.sets:
+                continue
+            key = (ex.name, ex.muscles or day.label)
+            if key not in row_of:
+                row_of[key] = len(weights)
+                weights.append(_muscle_weights(ex.muscles or _exercise_muscles(ex.name, day)))
+            day_index.append(row)
+            set_counts.append(ex.sets)
+            weight_rows.append(row_of[key])
+
+    if weights:
+        rows = np.asarray(day_index)
+        counts = np.asarray(set_counts, dtype=float)
+        per_set = np.vstack(weights)[weight_rows]
+        np.add.at(sets, rows, per_set * counts[:, None])
+        np.add.at(day_sets, rows, counts)
+    for row, source in repeats:
+        sets[row] = sets[source]
+        day_sets[row] = day_sets[source]
+    for row, _, fingerprint in fresh:
+        weighted = sets[row].copy()
+        weighted.flags.writeable = False
+        _DAY_VOLUME.put(fingerprint, (weighted, float(day_sets[row])))
+
+    return [
+        VolumeMatrix(sets=sets[start:end], day_sets=day_sets[start:end], weeks=_weeks(plan))
+        for plan, start, end in zip(plans, offsets, offsets[1:])
+    ]
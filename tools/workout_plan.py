@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Tuple
+
+from tools.muscles import label_key, label_mask, mask_of, names_of
+
+
+@dataclass(slots=True)
+class Exercise:
+    name: str
+    sets: Optional[int] = None
+    reps: str = ""
+    muscles: Tuple[str, ...] = ()
+
+    @property
+    def mask(self) -> int:
+        """Target muscles as a tools.muscles.Muscle bit mask."""
+        return mask_of(self.muscles)
+
+    def render(self) -> str:
+        if self.sets is None:
+            return f"  • {self.name}"
+        return f"  • {self.name} — {self.sets} sets × {self.reps}"
+
+
+@dataclass(slots=True)
+class WorkoutDay:
+    """
+    One training day. `heading` keeps the line exactly as written when the
+    day was parsed from text; otherwise it is rendered from the fields.
+    """
+
+    number: Optional[int]
+    label: Optional[str]
+    scheme: str = ""
+    exercises: List[Exercise] = field(default_factory=list)
+    heading: Optional[str] = None
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def title(self) -> str:
+        if self.heading is not None:
+            return self.heading
+        return f"Day {self.number}: {self.label} — {self.scheme}"
+
+    @property
+    def key(self) -> Optional[str]:
+        return label_key(self.label) if self.label is not None else None
+
+    @property
+    def mask(self) -> int:
+        """Muscles the split label trains, as a tools.muscles.Muscle bit mask."""
+        return label_mask(self.label) if self.label is not None else 0
+
+    @property
+    def muscles(self) -> FrozenSet[str]:
+        return frozenset(names_of(self.mask))
+
+    @property
+    def total_sets(self) -> int:
+        return sum(ex.sets or 0 for ex in self.exercises)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        The day's full content as one string: equal fingerprints mean every
+        per-day result is equal (see tools/day_cache.py). Built on first
+        access, so finish a day before reading it.
+        """
+        if self._fingerprint is None:
+            parts = [self.title]
+            for ex in self.exercises:
+                parts.append(f"{ex.name}\x1f{ex.sets}\x1f{ex.reps}\x1f{','.join(ex.muscles)}")
+            self._fingerprint = "\x1e".join(parts)
+        return self._fingerprint
+
+
+@dataclass(slots=True)
+class WorkoutPlan:
+    """
+    Structured workout plan handed between the planner, the exercise
+    generator and the validators.
+
+    Role:
+      - Tools build and read it directly; nobody re-parses text mid-pipeline.
+      - str(plan) renders the same text the tools have always returned, for
+        the UI, the result cache and LLM prompts.
+    """
+
+    goal: Optional[str]
+    days: List[WorkoutDay] = field(default_factory=list)
+    days_per_week: Optional[int] = None  # as requested; the split may differ
+    expanded: bool = False
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        """Lookup keys of every day that has a split label, in order."""
+        return tuple(day.key for day in self.days if day.label is not None)
+
+    def render(self) -> str:
+        if self.expanded:
+            lines = ["Expanded Workout Plan:\n"]
+            for day in self.days:
+                lines.append(day.title)
+                lines.extend(ex.render() for ex in day.exercises)
+                lines.append("")
+            return "\n".join(lines)
+
+        days = self.days_per_week if self.days_per_week is not None else len(self.days)
+        header = f"Workout Plan ({days} days) — Goal: {self.goal}\n\n"
+        return header + "".join(f"{day.title}\n" for day in self.days)
+
+    def __str__(self) -> str:
+        return self.render()
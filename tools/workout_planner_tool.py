@@ -1,41 +1,83 @@
-from typing import Dict
+from typing import Iterator
+
 from fairlib.core.interfaces.tools import AbstractTool
 
-class WorkoutPlannerTool(AbstractTool):
+from tools.batch import BatchToolMixin
+from tools.exercise_generator_tool import ExerciseGeneratorTool
+from tools.periodization import DELOAD_EVERY, PlanWeek, iter_weeks
+from tools.split_optimizer import MAX_DAYS, optimize_split, parse_constraints
+from tools.tool_input import InputSchema, ToolInputError, decode_tool_input
+from tools.workout_plan import WorkoutDay, WorkoutPlan
+
+SCHEME_STYLES = {
+    "strength": "5×5 compounds, long rest",
+    "hypertrophy": "8–12 reps, moderate weight",
+    "endurance": "12–20 reps, short rest",
+}
+
+
+class WorkoutPlannerTool(BatchToolMixin, AbstractTool):
     """
     Creates a workout plan based on user goals and schedule.
+
+    The split comes from tools.split_optimizer: the day types that best cover
+    every muscle group without training one inside its recovery window,
+    steered by optional free-text constraints.
     """
 
     name = "workout_planner"
     description = (
         "Create a workout plan. Input format: "
-        "{'days': int, 'goal': 'strength'|'hypertrophy'|'endurance'}"
+        "{'days': int, 'goal': 'strength'|'hypertrophy'|'endurance', "
+        "'constraints': str (optional, e.g. 'avoid overhead movements')}"
+    )
+    input_schema = InputSchema(
+        {"days": (int, 3), "goal": (str, "hypertrophy"), "constraints": (str, "")}
     )
 
     def use(self, tool_input: str) -> str:
-        data: Dict = eval(tool_input)  # FAIR tools expect string input
-        days = int(data.get("days", 3))
-        goal = data.get("goal", "hypertrophy")
-
-        splits = {
-            2: ["Upper Body", "Lower Body"],
-            3: ["Push", "Pull", "Legs"],
-            4: ["Upper", "Lower", "Push", "Pull"],
-            5: ["Push", "Pull", "Legs", "Upper", "Lower"],
-            6: ["Chest/Triceps", "Back/Biceps", "Legs", "Shoulders", "Arms", "Glutes/Hamstrings"],
-        }
-
-        style = {
-            "strength": "5×5 compounds, long rest",
-            "hypertrophy": "8–12 reps, moderate weight",
-            "endurance": "12–20 reps, short rest",
-        }
-
-        plan = splits.get(days, splits[3])
-        method = style.get(goal, style["hypertrophy"])
-        output = f"Workout Plan ({days} days) — Goal: {goal}\n\n"
-
-        for idx, day in enumerate(plan, 1):
-            output += f"Day {idx}: {day} — {method}\n"
-
-        return output
\ No newline at end of file
+        data = decode_tool_input(tool_input, self.input_schema)  # FAIR tools expect string input
+        return str(self.build(data["days"], data["goal"], data["constraints"]))
+
+    def batch_outputs(self, inputs):
+        # Inputs arrive deduplicated, and optimize_split() memoizes the
+        # split, so each (days, goal, constraints) is built once.
+        return [
+            str(self.build(data["days"], data["goal"], data["constraints"]))
+            for data in inputs
+        ]
+
+    def build(self, days: int, goal: str, constraints: str = "") -> WorkoutPlan:
+        """Structured form of use(): the plan as a WorkoutPlan."""
+        if not 1 <= days <= MAX_DAYS:
+            raise ToolInputError(
+                f"Field 'days' must be between 1 and {MAX_DAYS} training days, got {days}."
+            )
+        plan = optimize_split(days, parse_constraints(constraints))
+        method = SCHEME_STYLES.get(goal, SCHEME_STYLES["hypertrophy"])
+
+        return WorkoutPlan(
+            goal=goal,
+            days=[
+                WorkoutDay(number=idx, label=day, scheme=method)
+                for idx, day in enumerate(plan, 1)
+            ],
+            days_per_week=days,
+        )
+
+    def build_weeks(
+        self,
+        days: int,
+        goal: str,
+        weeks: int,
+        model: str = "linear",
+        constraints: str = "",
+        deload_every: int = DELOAD_EVERY,
+    ) -> Iterator[PlanWeek]:
+        """
+        Periodization mode: the plan expanded with exercises and progressed
+        over `weeks` weeks ("linear", "undulating" or "block", with deloads),
+        yielded lazily one week at a time (see tools/periodization.py).
+        """
+        plan = ExerciseGeneratorTool().expand(self.build(days, goal, constraints), goal)
+        return iter_weeks(plan, weeks, model, deload_every)
@@ -0,0 +1,206 @@
+import contextvars
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from fairlib import ToolExecutor
+from fairlib.core.interfaces.llm import AbstractChatModel
+from fairlib.core.message import Message
+
+# Try to use a real tokenizer; fall back to the ~4 chars/token heuristic.
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    TIKTOKEN_AVAILABLE = False
+
+DEFAULT_TRACE_PATH = os.getenv(
+    "WORKOUT_TRACE_PATH", str(Path(".cache") / "pipeline_traces.jsonl")
+)
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return max(1, len(text) // 4)
+
+
+# ============================
+# Trace Records
+# ============================
+@dataclass
+class StageTrace:
+    """Timings and counters for one pipeline stage."""
+
+    stage: str
+    wall_s: float = 0.0
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    llm_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    react_steps: int = 0
+    tool_calls: int = 0
+    tool_s: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class PipelineTrace:
+    """All stage traces for one request, serializable as one JSON line."""
+
+    request_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: float = field(default_factory=time.time)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    stages: Dict[str, StageTrace] = field(default_factory=dict)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTrace]:
+        """
+        Times a stage and makes it the target of every LLM and tool call made
+        in the current async context (i.e. by this stage's task only).
+        """
+        stage_trace = self.stages.setdefault(name, StageTrace(stage=name))
+        token = _current_stage.set(stage_trace)
+        started = time.perf_counter()
+        try:
+            yield stage_trace
+        except BaseException as e:
+            stage_trace.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            stage_trace.wall_s += time.perf_counter() - started
+            _current_stage.reset(token)
+
+    @property
+    def total_s(self) -> float:
+        return sum(s.wall_s for s in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "started_at": self.started_at,
+            "metadata": self.metadata,
+            "tokens_estimated": not TIKTOKEN_AVAILABLE,
+            "stages": [asdict(s) for s in self.stages.values()],
+        }
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """One flat, rounded row per stage, for tables in the UI or CLI."""
+        return [
+            {
+                "stage": s.stage,
+                "wall (s)": round(s.wall_s, 3),
+                "LLM calls": s.llm_calls,
+                "LLM cache hits": s.llm_cache_hits,
+                "LLM (s)": round(s.llm_s, 3),
+                "prompt tok": s.prompt_tokens,
+                "completion tok": s.completion_tokens,
+                "ReAct steps": s.react_steps,
+                "tool calls": s.tool_calls,
+                "tool (s)": round(s.tool_s, 4),
+            }
+            for s in self.stages.values()
+        ]
+
+    def write(self, path: str = DEFAULT_TRACE_PATH):
+        """Appends this trace as one JSON line to `path`."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.to_dict()) + "\n")
+
+
+_current_stage: contextvars.ContextVar[Optional[StageTrace]] = contextvars.ContextVar(
+    "current_stage_trace", default=None
+)
+
+
+def current_stage() -> Optional[StageTrace]:
+    return _current_stage.get()
+
+
+@contextmanager
+def tool_timer() -> Iterator[None]:
+    """Records a tool call made outside a ToolExecutor (e.g. direct dispatch)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_trace = _current_stage.get()
+        if stage_trace is not None:
+            stage_trace.tool_calls += 1
+            stage_trace.tool_s += time.perf_counter() - started
+
+
+# ============================
+# Instrumented Components
+# ============================
+class InstrumentedChatModel(AbstractChatModel):
+    """
+    Wraps a chat model and records every call against the current stage.
+
+    Each ReActPlanner step makes exactly one LLM call, so a call made while
+    planning also counts as one ReAct step. Outside a traced stage the
+    wrapper only adds one context-variable lookup per call.
+    """
+
+    def __init__(self, inner: AbstractChatModel):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        # Expose adapter-specific attributes (model_name, clients, ...).
+        return getattr(self.inner, name)
+
+    def _record(self, messages: List[Message], response: Message, elapsed: float):
+        stage_trace = _current_stage.get()
+        if stage_trace is None:
+            return
+        stage_trace.llm_calls += 1
+        if response.metadata.get("cache_hit"):
+            stage_trace.llm_cache_hits += 1
+        stage_trace.react_steps += 1
+        stage_trace.llm_s += elapsed
+        stage_trace.prompt_tokens += sum(count_tokens(m.content or "") for m in messages)
+        stage_trace.completion_tokens += count_tokens(response.content or "")
+
+    def invoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        started = time.perf_counter()
+        response = self.inner.invoke(messages, **kwargs)
+        self._record(messages, response, time.perf_counter() - started)
+        return response
+
+    async def ainvoke(self, messages: List[Message], **kwargs: Any) -> Message:
+        started = time.perf_counter()
+        response = await self.inner.ainvoke(messages, **kwargs)
+        self._record(messages, response, time.perf_counter() - started)
+        return response
+
+    def stream(self, messages: List[Message], **kwargs: Any) -> Iterator[Message]:
+        return self.inner.stream(messages, **kwargs)
+
+    def astream(self, messages: List[Message], **kwargs: Any) -> AsyncIterator[Message]:
+        return self.inner.astream(messages, **kwargs)
+
+    def get_model_capabilities(self) -> Dict[str, Any]:
+        return self.inner.get_model_capabilities()
+
+
+class InstrumentedToolExecutor(ToolExecutor):
+    """ToolExecutor that records tool call counts and durations per stage."""
+
+    def execute(self, tool_name: str, tool_input: str) -> str:
+        with tool_timer():
+            return super().execute(tool_name, tool_input)
+
+    async def aexecute(self, tool_name: str, tool_input: str) -> str:
+        with tool_timer():
+            return await super().aexecute(tool_name, tool_input)
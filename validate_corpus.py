@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jsonl_io import completed_ids, open_output
+from tools.exercise_catalog import ExerciseCatalog
+from tools.muscle_coverage_tool import MuscleCoverageValidatorTool
+from tools.recovery_balance_tool import RecoveryBalanceTool
+from tools.safety_tool import SafetyCheckTool
+
+PLAN_SUFFIXES = (".txt", ".md")
+
+# JSONL fields that may hold the plan text, in order of preference
+# ("expanded" is what batch_pipeline.py writes for the validated plan).
+PLAN_FIELDS = ("plan_text", "expanded", "plan")
+
+# (plan id, path to read the plan from, plan text); exactly one of the last two is set.
+CorpusItem = Tuple[str, Optional[str], Optional[str]]
+
+
+# --------------------------
+# Corpus Readers
+# --------------------------
+def iter_directory(root: str) -> Iterator[CorpusItem]:
+    """
+    Yields every plan file under `root` (one plan per .txt / .md file), in a
+    stable order, without listing the whole tree up front. The workers read
+    the files; only paths pass through the parent.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(PLAN_SUFFIXES):
+                path = os.path.join(dirpath, filename)
+                yield os.path.relpath(path, root), path, None
+
+
+def iter_jsonl(path: str) -> Iterator[CorpusItem]:
+    """
+    Yields one plan per non-empty JSONL line. The text is taken from the
+    first of PLAN_FIELDS present, the id from "id" or "request_id", falling
+    back to the line number. Unreadable lines yield an empty plan, which is
+    reported as an error.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield str(line_no), None, ""
+                continue
+            plan_id = str(record.get("id") or record.get("request_id") or line_no)
+            text = next((record[field] for field in PLAN_FIELDS if record.get(field)), "")
+            yield plan_id, None, str(text)
+
+
+def iter_corpus(path: str) -> Iterator[CorpusItem]:
+    return iter_directory(path) if os.path.isdir(path) else iter_jsonl(path)
+
+
+def chunked(items: Iterator[CorpusItem], size: int) -> Iterator[List[CorpusItem]]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# --------------------------
+# Worker Side
+# --------------------------
+_validators: List[Any] = []
+
+
+def _init_worker():
+    # One set of tools per process; their parse / decode caches stay warm
+    # across every chunk the process handles.
+    _validators[:] = [MuscleCoverageValidatorTool(), RecoveryBalanceTool(), SafetyCheckTool()]
+
+
+def validate_chunk(chunk: List[CorpusItem]) -> List[Dict[str, Any]]:
+    """
+    Runs every validator over one chunk of plans with use_batch() and merges
+    the reports into one record per plan.
+    """
+    records = []
+    plans = []
+    for plan_id, path, text in chunk:
+        record = {"id": plan_id, "status": "ok"}
+        if path is not None:
+            try:
+                text = Path(path).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                record.update(status="error", error=f"{type(e).__name__}: {e}")
+        if record["status"] == "ok" and not text.strip():
+            record.update(status="error", error="No plan text found.")
+        records.append(record)
+        plans.append({"plan": text or ""})
+
+    for tool in _validators:
+        try:
+            outputs = tool.use_batch(plans, return_exceptions=True)
+        except Exception as e:
+            outputs = [e] * len(plans)
+        for record, output in zip(records, outputs):
+            if record["status"] != "ok":
+                continue
+            if isinstance(output, Exception):
+                record.update(status="error", error=f"{tool.name}: {output}")
+            else:
+                record[tool.name] = output
+
+    for record in records:
+        if record["status"] != "ok":
+            for tool in _validators:
+                record.pop(tool.name, None)
+    return records
+
+
+# --------------------------
+# Corpus Runner
+# --------------------------
+def run_corpus(
+    input_path: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    overwrite: bool = False,
+) -> Dict[str, int]:
+    """
+    Validates every plan in `input_path` (a directory of plan files or a
+    JSONL file) across a pool of `workers` processes.
+
+    Role:
+      - Plans are read lazily and sent to the pool in chunks of `chunk_size`;
+        at most two chunks per worker are in flight, so memory stays flat
+        however large the corpus is.
+      - Each finished chunk is appended to `output_path` right away, in
+        completion order (records carry their id).
+      - Unless `overwrite` is set, plans already written with status "ok"
+        are skipped, so an interrupted run resumes where it stopped.
+    """
+    workers = workers or os.cpu_count() or 1
+    skip = set() if overwrite else completed_ids(output_path)
+    stats = {"ok": 0, "error": 0, "skipped": 0}
+
+    def pending_items() -> Iterator[CorpusItem]:
+        for item in iter_corpus(input_path):
+            if item[0] in skip:
+                stats["skipped"] += 1
+                continue
+            yield item
+
+    # Build the exercise catalog once here instead of racing in every worker.
+    ExerciseCatalog().close()
+
+    with open_output(output_path, overwrite) as out, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as pool:
+
+        def collect(futures, return_when):
+            done, not_done = wait(futures, return_when=return_when)
+            for future in done:
+                for record in future.result():
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    stats[record["status"]] += 1
+            out.flush()
+            return not_done
+
+        in_flight = set()
+        for chunk in chunked(pending_items(), max(1, chunk_size)):
+            in_flight.add(pool.submit(validate_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                in_flight = collect(in_flight, FIRST_COMPLETED)
+        if in_flight:
+            collect(in_flight, ALL_COMPLETED)
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the coverage, recovery and safety validators over a corpus of plans."
+    )
+    parser.add_argument(
+        "input",
+        help="directory of plan files (.txt/.md) or JSONL file with a plan per line",
+    )
+    parser.add_argument(
+        "-o", "--output", default="validation_results.jsonl",
+        help="JSONL file reports are streamed to (default: validation_results.jsonl)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=256,
+        help="plans sent to a worker at a time (default: 256)",
+    )
+    parser.add_argument(
+        "--overwrite", action="store_true",
+        help="start over instead of resuming from an existing output file",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = run_corpus(
+        args.input,
+        args.output,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        overwrite=args.overwrite,
+    )
+    elapsed = time.perf_counter() - started
+    validated = stats["ok"] + stats["error"]
+
+    print(
+        f"🩺 Validated {validated} plans in {elapsed:.1f}s "
+        f"({validated / elapsed if elapsed else 0:.0f} plans/s) — "
+        f"{stats['ok']} ok, {stats['error']} errors, {stats['skipped']} already done. "
+        f"Reports: {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,16 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fairlib import SimpleAgent, ReActPlanner, ToolRegistry, ToolExecutor, WorkingMemory
-from fairlib.modules.mal.openai_adapter import OpenAIAdapter
+from typing import Optional
+
+from fairlib.core.interfaces.llm import AbstractChatModel
+from llm_factory import build_react_agent
 from tools.muscle_coverage_tool import MuscleCoverageValidatorTool
 from tools.recovery_balance_tool import RecoveryBalanceTool
 import asyncio
 
 
-async def build_validator_agent():
+async def build_validator_agent(llm: Optional[AbstractChatModel] = None):
     """
     Builds the Validator Agent.
 
@@ -16,23 +18,11 @@ async def build_validator_agent():
       - Takes a generated workout plan as text.
       - Uses tools to check muscle coverage and recovery/balance.
       - Produces a critique and suggestions.
+
+    Args:
+      llm: Chat model to use. Defaults to the process-wide shared adapter.
     """
-    llm = OpenAIAdapter()
-
-    registry = ToolRegistry()
-    registry.register_tool(MuscleCoverageValidatorTool())
-    registry.register_tool(RecoveryBalanceTool())
-
-    executor = ToolExecutor(registry)
-    memory = WorkingMemory()
-    planner = ReActPlanner(llm, registry)
-
-    return SimpleAgent(
-        llm=llm,
-        planner=planner,
-        tool_executor=executor,
-        memory=memory,
-    )
+    return build_react_agent([MuscleCoverageValidatorTool(), RecoveryBalanceTool()], llm)
 
 
 async def main():
@@ -1,37 +1,27 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fairlib import SimpleAgent, ReActPlanner, ToolRegistry, ToolExecutor, WorkingMemory
-from fairlib.modules.mal.openai_adapter import OpenAIAdapter
+from typing import Optional
+
+from fairlib.core.interfaces.llm import AbstractChatModel
+from llm_factory import build_react_agent
 from tools.workout_planner_tool import WorkoutPlannerTool
 from tools.exercise_generator_tool import ExerciseGeneratorTool
 import asyncio
 
 
-async def build_workout_agent():
+async def build_workout_agent(llm: Optional[AbstractChatModel] = None):
     """
     Builds the Workout Agent.
 
     Role:
       - Takes the user's high-level workout request (days, goal).
       - Uses WorkoutPlannerTool to generate an initial split.
+
+    Args:
+      llm: Chat model to use. Defaults to the process-wide shared adapter.
     """
-    llm = OpenAIAdapter()  # Uses model & keys from your .env / env vars
-
-    registry = ToolRegistry()
-    registry.register_tool(WorkoutPlannerTool())
-    registry.register_tool(ExerciseGeneratorTool())
-
-    executor = ToolExecutor(registry)
-    memory = WorkingMemory()
-    planner = ReActPlanner(llm, registry)
-
-    return SimpleAgent(
-        llm=llm,
-        planner=planner,
-        tool_executor=executor,
-        memory=memory,
-    )
+    return build_react_agent([WorkoutPlannerTool(), ExerciseGeneratorTool()], llm)
 
 
 async def main():
@@ -0,0 +1,154 @@
+from typing import Optional
+
+from fairlib import SimpleAgent
+
+from bounded_memory import BoundedMemory
+from pipeline import Pipeline, Stage
+from tracing import tool_timer
+from tools.exercise_generator_tool import ExerciseGeneratorTool
+from tools.plan_parser import parse_plan
+from tools.workout_plan import WorkoutPlan
+from tools.workout_planner_tool import WorkoutPlannerTool
+
+
+# Outputs produced by every workout pipeline, in display order.
+STAGE_NAMES = ("plan", "expanded", "validation", "safety")
+
+
+# --------------------------
+# Agent Helpers
+# --------------------------
+def with_fresh_memory(agent: SimpleAgent) -> SimpleAgent:
+    """
+    Returns a SimpleAgent sharing `agent`'s LLM, planner and tool executor
+    but with its own empty (token-budgeted) memory, so concurrent requests
+    never see each other's conversation state.
+    """
+    return SimpleAgent(
+        llm=agent.llm,
+        planner=agent.planner,
+        tool_executor=agent.tool_executor,
+        memory=BoundedMemory(),
+        max_steps=agent.max_steps,
+    )
+
+
+# --------------------------
+# Stage Prompts
+# --------------------------
+def workout_prompt(user_request: str) -> str:
+    return (
+        "You are a workout-planning agent. The user request is:\n"
+        f"\"{user_request}\"\n\n"
+        "Use ONLY the 'workout_planner' tool.\n"
+        "- Do NOT rewrite or summarize.\n"
+        "- Do NOT add introductory text.\n"
+        "- Do NOT merge days.\n"
+        "- Return ONLY the tool output EXACTLY as produced.\n"
+        "- Keep 'Day 1:', 'Day 2:' structure untouched."
+    )
+
+
+def expanded_prompt(plan) -> str:
+    return (
+        "Expand this workout split using ONLY the 'exercise_generator' tool.\n"
+        "RULES:\n"
+        "  - Do NOT add explanations.\n"
+        "  - Do NOT change any text outside exercises.\n"
+        "  - Do NOT remove or alter 'Day 1:' / 'Day 2:' labels.\n"
+        "  - Do NOT add intros like 'Here is your expanded plan'.\n"
+        "  - Only return the tool output.\n\n"
+        f"{plan}"
+    )
+
+
+def validator_prompt(expanded) -> str:
+    return (
+        "Evaluate the workout plan below using VALIDATION TOOLS ONLY:\n"
+        "1. Check muscle group coverage\n"
+        "2. Check recovery & sequence balance\n"
+        "3. Summarize any issues found\n\n"
+        f"{expanded}"
+    )
+
+
+def safety_prompt(expanded) -> str:
+    return (
+        "Use ONLY the 'safety_checker' tool to analyze this workout for:\n"
+        "- Dangerous exercise combinations\n"
+        "- Overuse concerns\n"
+        "- High-risk sequencing\n\n"
+        f"{expanded}"
+    )
+
+
+# --------------------------
+# Pipeline Definition
+# --------------------------
+def build_workout_pipeline(
+    workout_agent: Optional[SimpleAgent],
+    validator_agent: SimpleAgent,
+    safety_agent: SimpleAgent,
+    direct_dispatch: bool = False,
+) -> Pipeline:
+    """
+    Declares the multi-agent workout pipeline as a dependency graph:
+
+        user_request -> plan -> expanded -> {validation, safety}
+
+    Validation and safety both depend only on the expanded plan, so the
+    executor runs them concurrently.
+
+    With direct_dispatch=True the first two stages skip the workout agent and
+    call WorkoutPlannerTool / ExerciseGeneratorTool themselves. Those tools are
+    pure Python and their arguments are already known, so the graph becomes
+
+        (days, goal, extra_instructions) -> plan -> expanded -> {validation, safety}
+
+    and only the stages that need reasoning still pay for LLM round trips.
+    The plan and expanded outputs are then WorkoutPlan objects rather than
+    text; str() renders them wherever text is needed (prompts, UI, caches).
+    """
+
+    async def validation(expanded) -> str:
+        return str(await validator_agent.arun(validator_prompt(expanded)))
+
+    async def safety(expanded) -> str:
+        return str(await safety_agent.arun(safety_prompt(expanded)))
+
+    if direct_dispatch:
+        planner_tool = WorkoutPlannerTool()
+        generator_tool = ExerciseGeneratorTool()
+
+        async def plan_direct(days: int, goal: str, extra_instructions: str) -> WorkoutPlan:
+            with tool_timer():
+                return planner_tool.build(int(days), goal, extra_instructions or "")
+
+        async def expanded_direct(plan, goal: str) -> WorkoutPlan:
+            if isinstance(plan, str):
+                # e.g. a plan seeded from the result cache
+                plan = parse_plan(plan)
+            with tool_timer():
+                return generator_tool.expand(plan, goal)
+
+        plan_stage = Stage("plan", plan_direct, depends_on=("days", "goal", "extra_instructions"))
+        expanded_stage = Stage("expanded", expanded_direct, depends_on=("plan", "goal"))
+    else:
+        if workout_agent is None:
+            raise ValueError("workout_agent is required unless direct_dispatch=True.")
+
+        async def plan_agent(user_request: str) -> str:
+            return str(await workout_agent.arun(workout_prompt(user_request)))
+
+        async def expanded_agent(plan: str) -> str:
+            return str(await workout_agent.arun(expanded_prompt(plan)))
+
+        plan_stage = Stage("plan", plan_agent, depends_on=("user_request",))
+        expanded_stage = Stage("expanded", expanded_agent, depends_on=("plan",))
+
+    return Pipeline([
+        plan_stage,
+        expanded_stage,
+        Stage("validation", validation, depends_on=("expanded",)),
+        Stage("safety", safety, depends_on=("expanded",)),
+    ])